@@ -20,16 +20,84 @@
 #   then pip-installs PySide6, numpy, sounddevice, soundfile.
 #   Sudo je potreban jer se instaliraju **sistemske** biblioteke (PortAudio).
 
-import sys, os, json, queue, datetime, collections, typing, weakref, subprocess
+import sys, os, json, datetime, collections, typing, weakref, subprocess
+import functools, math, threading, types, contextlib, time
+import concurrent.futures, struct
 import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; the level detector falls back to NumPy
+    njit = None
+try:
+    import orjson  # optional, faster session log (de)serialization
+except ImportError:
+    orjson = None
 from PySide6 import QtCore, QtGui, QtWidgets
 from PySide6.QtMultimedia import QMediaPlayer, QAudioOutput
-import sounddevice as sd
+import soundfile as sf
+
+# sounddevice is imported where a stream is opened: importing it initializes
+# PortAudio, which --setup must be able to run without.
 
 VERSION = "0.2"
 APP_DIR = os.path.dirname(os.path.abspath(__file__))
 
 
+# ===================== File I/O helpers =====================
+def _loads(data: bytes):
+    """Parse UTF-8 JSON bytes (orjson when installed)."""
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
+def _dumps(obj) -> bytes:
+    """Serialize to indented UTF-8 JSON bytes (orjson when installed)."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
+
+
+def _dumps_line(obj) -> bytes:
+    """Serialize to one compact JSON line, newline included (JSONL records)."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE)
+    line = json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+    return (line + "\n").encode("utf-8")
+
+
+# libsndfile's Vorbis encoder crashes on single writes of a couple of million
+# frames; every SoundFile write goes through _sf_write in slices of this size
+_SF_WRITE_FRAMES = 65536
+
+
+def _sf_write(f: "sf.SoundFile", data: np.ndarray) -> None:
+    """f.write(data) in bounded slices."""
+    for i in range(0, len(data), _SF_WRITE_FRAMES):
+        f.write(data[i : i + _SF_WRITE_FRAMES])
+
+
+_ENSURED_DIRS: set = set()
+
+
+def _ensure_dir(path: str) -> None:
+    """os.makedirs(exist_ok=True), but only once per directory per process."""
+    if path in _ENSURED_DIRS:
+        return
+    os.makedirs(path, exist_ok=True)
+    _ENSURED_DIRS.add(path)
+
+
+# ===================== date/time formatting =====================
+@functools.lru_cache(maxsize=4096)
+def _strftime(dt: datetime.datetime, fmt: str) -> str:
+    """dt.strftime(fmt), memoized: table refreshes format the same stamps again.
+
+    The format string is part of the key, so a date/time format change simply
+    misses instead of needing a cache_clear().
+    """
+    return dt.strftime(fmt)
+
+
 # ===================== Wake Lock (prevent sleep/hibernate) =====================
 class WakeLock:
     """Prevent system sleep/hibernate while monitoring. Display can still turn off."""
@@ -132,13 +200,10 @@ def detect_distro() -> str:
         with open("/etc/os-release", "r", encoding="utf-8") as f:
             data = f.read().lower()
 
-        def val(k):
-            for line in data.splitlines():
-                if line.startswith(k + "="):
-                    return line.split("=", 1)[1].strip().strip('"')
-            return ""
+        kv = dict(line.split("=", 1) for line in data.splitlines() if "=" in line)
+        kv = {k.strip(): v.strip().strip('"') for k, v in kv.items()}
 
-        blob = val("id") + " " + val("id_like")
+        blob = kv.get("id", "") + " " + kv.get("id_like", "")
         if any(x in blob for x in ["ubuntu", "debian", "linuxmint", "elementary"]):
             return "debian"
         if any(x in blob for x in ["fedora", "rhel", "centos"]):
@@ -147,7 +212,7 @@ def detect_distro() -> str:
             return "arch"
         if any(x in blob for x in ["opensuse", "suse", "sle"]):
             return "opensuse"
-        return val("id") or ""
+        return kv.get("id", "")
     except Exception:
         return ""
 
@@ -211,6 +276,13 @@ THEME_PALETTE = dict(
 
 
 def qss_for(p: dict) -> str:
+    """Build the app stylesheet for palette ``p`` (memoized per palette)."""
+    return _qss_for_items(tuple(sorted(p.items())))
+
+
+@functools.lru_cache(maxsize=8)
+def _qss_for_items(items: tuple) -> str:
+    p = dict(items)
     btn_fg = "#000" if p["accent2"].lower() in ("#ffffff", "#fff") else p["fg"]
     sel_fg = "#000" if p["accent2"].lower() in ("#ffffff", "#fff") else "#fff"
     return f"""
@@ -442,7 +514,23 @@ QScrollBar::handle:vertical {{
 """
 
 
+@functools.lru_cache(maxsize=8)
+def header_qss(fg: str, border: str) -> str:
+    """Stylesheet for table header sections."""
+    return (
+        f"QHeaderView::section {{"
+        f"background: rgba(255,255,255,0.08);"
+        f"color: {fg};"
+        f"border: 0;"
+        f"border-bottom: 1px solid {border};"
+        f"padding: 8px 10px; }}"
+    )
+
+
 # ===================== icons =====================
+# Procedural icons are rasterized once per (size, color); QIcon is implicitly
+# shared, so handing the same instance to many buttons is safe.
+@functools.lru_cache(maxsize=32)
 def icon_play(size=20, color="#ffffff") -> QtGui.QIcon:
     pix = QtGui.QPixmap(size, size)
     pix.fill(QtCore.Qt.GlobalColor.transparent)
@@ -460,6 +548,7 @@ def icon_play(size=20, color="#ffffff") -> QtGui.QIcon:
     return QtGui.QIcon(pix)
 
 
+@functools.lru_cache(maxsize=32)
 def icon_stop(size=20, color="#ffffff") -> QtGui.QIcon:
     pix = QtGui.QPixmap(size, size)
     pix.fill(QtCore.Qt.GlobalColor.transparent)
@@ -473,6 +562,7 @@ def icon_stop(size=20, color="#ffffff") -> QtGui.QIcon:
     return QtGui.QIcon(pix)
 
 
+@functools.lru_cache(maxsize=32)
 def icon_trash(size=18, color="#ffffff") -> QtGui.QIcon:
     pix = QtGui.QPixmap(size, size)
     pix.fill(QtCore.Qt.GlobalColor.transparent)
@@ -510,6 +600,7 @@ def icon_trash(size=18, color="#ffffff") -> QtGui.QIcon:
     return QtGui.QIcon(pix)
 
 
+@functools.lru_cache(maxsize=32)
 def icon_mic(size=18, color="#ffffff") -> QtGui.QIcon:
     pix = QtGui.QPixmap(size, size)
     pix.fill(QtCore.Qt.GlobalColor.transparent)
@@ -532,6 +623,36 @@ def icon_mic(size=18, color="#ffffff") -> QtGui.QIcon:
     return QtGui.QIcon(pix)
 
 
+def clear_icon_cache() -> None:
+    """Drop memoized icons and pixmaps (call before QApplication goes away)."""
+    for fn in (icon_play, icon_stop, icon_trash, icon_mic, icon_app, about_pixmap):
+        fn.cache_clear()
+
+
+@functools.lru_cache(maxsize=2)
+def about_pixmap(image_path: str, mtime: float) -> QtGui.QPixmap:
+    """About-tab image: 20px border cropped, scaled to fit 400x320 (per file mtime)."""
+    # Load original image with transparency
+    pixmap = QtGui.QPixmap(image_path)
+    original_size = pixmap.size()
+    crop_rect = QtCore.QRect(
+        20, 20, original_size.width() - 40, original_size.height() - 40
+    )
+
+    # Crop the image to remove 20px border
+    if crop_rect.isValid() and crop_rect.width() > 0 and crop_rect.height() > 0:
+        pixmap = pixmap.copy(crop_rect)
+
+    # Scale the cropped image to larger size for zoom effect
+    return pixmap.scaled(
+        400,
+        320,
+        QtCore.Qt.AspectRatioMode.KeepAspectRatio,
+        QtCore.Qt.TransformationMode.SmoothTransformation,
+    )
+
+
+@functools.lru_cache(maxsize=32)
 def icon_app(size=64) -> QtGui.QIcon:
     """Load app icon from Icons folder."""
     icons_dir = os.path.join(APP_DIR, "Icons")
@@ -574,103 +695,386 @@ def icon_app(size=64) -> QtGui.QIcon:
     return QtGui.QIcon(pix)
 
 
-# ===================== Waveform Widget =====================
-class WaveformWidget(QtWidgets.QWidget):
-    """Mini waveform/histogram visualization for audio clips."""
+# ===================== level detector =====================
+# layout of the float32 detector state: [smooth_db, above_ms, below_ms]
+_DET_EMA, _DET_ABOVE, _DET_BELOW = 0, 1, 2
+# _hyst_step result bits: start a clip on this block / the hang time ran out
+_HYST_ARM, _HYST_STOP = 1, 2
+# below this mean square (RMS < 1e-5) a block counts as digital silence and its
+# level is pinned to the detector floor, 20*log10(sqrt(EPS)) for EPS=1e-8,
+# which skips the log10 (< 0.05 dB off the exact value)
+_SILENCE_MS = 1e-10
+_SILENCE_DB = -80.0
 
-    def __init__(self, audio_path: str, parent=None):
-        super().__init__(parent)
-        self.audio_path = audio_path
-        self.samples = self._load_samples()
-        self.setMinimumHeight(32)
-        self.setMinimumWidth(120)
+# float32 int16 quantization constants, so the WAV conversion never promotes
+# the clip to float64 (a Python float literal would with NumPy < 2)
+_I16_SCALE = np.float32(32767.0)
+_I16_MIN = np.float32(-32767.0)
+_I16_MAX = np.float32(32767.0)
 
-    def _load_samples(self) -> list:
-        """Load and downsample audio for visualization."""
+if njit is not None:
+
+    _F32 = np.float32
+
+    @njit(
+        "float32(float32[::1], float32[::1], float32, float32, float32, float32)",
+        cache=True,
+        fastmath=True,
+    )
+    def _detect(block, state, alpha, threshold_db, rate, eps):
+        """RMS of one block; updates the EMA and arm/hang counters in ``state``.
+
+        Keeping the state in a small float32 array lets the JIT update it unboxed,
+        so the hot path never round-trips through Python floats. Everything stays
+        float32 (log10f rather than log10); a few hundred samples per block need
+        no wider accumulator.
+        """
+        n = block.shape[0]
+        sumsq = _F32(0.0)
+        for i in range(n):
+            s = block[i]
+            sumsq += s * s
+        ms = sumsq / _F32(max(n, 1))
+        rms = np.sqrt(ms + eps)
+        if ms < _F32(_SILENCE_MS):
+            inst_db = _F32(_SILENCE_DB)
+        else:
+            inst_db = _F32(20.0) * np.log10(rms + eps)
+        ema = alpha * inst_db + (_F32(1.0) - alpha) * state[_DET_EMA]
+        state[_DET_EMA] = ema
+        block_ms = _F32(n) * _F32(1000.0) / rate
+        if ema >= threshold_db:
+            state[_DET_ABOVE] += block_ms
+            state[_DET_BELOW] = 0.0
+        else:
+            state[_DET_BELOW] += block_ms
+            state[_DET_ABOVE] = 0.0
+        return rms
+
+    @njit(
+        "void(float32[:, ::1], float32[::1], float32, float32, float32, float32,"
+        " float32[:, ::1])",
+        cache=True,
+        fastmath=True,
+    )
+    def _detect_batch(blocks, state, alpha, threshold_db, rate, eps, out):
+        """_detect over every row of ``blocks`` in one call.
+
+        Row ``i`` of ``out`` receives [rms, smooth_db, above_ms, below_ms] as
+        they stand after block ``i``.
+        """
+        for b in range(blocks.shape[0]):
+            out[b, 0] = _detect(blocks[b], state, alpha, threshold_db, rate, eps)
+            out[b, 1] = state[_DET_EMA]
+            out[b, 2] = state[_DET_ABOVE]
+            out[b, 3] = state[_DET_BELOW]
+
+    @njit("int64(float32[::1], boolean, float32, float32, float32)", cache=True)
+    def _hyst_step(state, capturing, arm_ms, hang_ms, stop_th):
+        """Arm/hang decision for one block from the detector ``state`` after it.
+
+        Returns a mask of _HYST_ARM (start capturing) and _HYST_STOP (level held
+        below the hysteresis threshold for the hang time). A clip armed on this
+        block is checked for stopping on the same block, as before.
+        """
+        act = 0
+        if not capturing:
+            if state[_DET_ABOVE] < arm_ms:
+                return 0
+            act = _HYST_ARM
+        if state[_DET_EMA] < stop_th and state[_DET_BELOW] >= hang_ms:
+            act |= _HYST_STOP
+        return act
+
+else:
+
+    def _detect(block, state, alpha, threshold_db, rate, eps):
+        """NumPy fallback of the numba detector (numba not installed)."""
+        # one BLAS dot (sdot): square and sum in a single pass, no temporary array
+        n = block.shape[0]
+        ms = float(np.dot(block, block)) / max(n, 1)
+        rms = math.sqrt(ms + eps)
+        if ms < _SILENCE_MS:
+            inst_db = _SILENCE_DB
+        else:
+            inst_db = 20.0 * math.log10(rms + eps)
+        ema = alpha * inst_db + (1.0 - alpha) * state[_DET_EMA]
+        state[_DET_EMA] = ema
+        block_ms = n * 1000.0 / rate
+        if ema >= threshold_db:
+            state[_DET_ABOVE] += block_ms
+            state[_DET_BELOW] = 0.0
+        else:
+            state[_DET_BELOW] += block_ms
+            state[_DET_ABOVE] = 0.0
+        return rms
+
+    def _detect_batch(blocks, state, alpha, threshold_db, rate, eps, out):
+        """NumPy fallback of the batch detector: levels and EMA are vectorized."""
+        k, n = blocks.shape
+        ms = np.einsum("ij,ij->i", blocks, blocks) / max(n, 1)
+        rms = np.sqrt(ms + eps)
+        inst_db = np.full(k, _SILENCE_DB)
+        loud = ms >= _SILENCE_MS
+        inst_db[loud] = 20.0 * np.log10(rms[loud] + eps)
+        # closed-form EMA, e_i = b^(i+1)*e_0 + alpha * sum_{j<=i} b^(i-j)*x_j, taken
+        # in short runs so b^-j stays finite for any alpha
+        ema = np.empty(k)
+        b, prev = 1.0 - alpha, float(state[_DET_EMA])
+        for lo in range(0, k, 32):
+            x = inst_db[lo : lo + 32]
+            pw = b ** np.arange(1, len(x) + 1)
+            ema[lo : lo + 32] = pw * prev + alpha * pw * np.cumsum(x / pw)
+            prev = ema[lo + len(x) - 1]
+        block_ms = n * 1000.0 / rate
+        above, below = float(state[_DET_ABOVE]), float(state[_DET_BELOW])
+        for i in range(k):
+            if ema[i] >= threshold_db:
+                above += block_ms
+                below = 0.0
+            else:
+                below += block_ms
+                above = 0.0
+            out[i, 2] = above
+            out[i, 3] = below
+        out[:, 0] = rms
+        out[:, 1] = ema
+        state[:] = out[k - 1, 1:]
+
+    def _hyst_step(state, capturing, arm_ms, hang_ms, stop_th):
+        """Plain-Python fallback of the numba arm/hang decision."""
+        act = 0
+        if not capturing:
+            if state[_DET_ABOVE] < arm_ms:
+                return 0
+            act = _HYST_ARM
+        if state[_DET_EMA] < stop_th and state[_DET_BELOW] >= hang_ms:
+            act |= _HYST_STOP
+        return act
+
+
+# ===================== Waveform Delegate =====================
+class WaveformDelegate(QtWidgets.QStyledItemDelegate):
+    """Paints the mini waveform of the recordings table's Waveform column.
+
+    Rows carry only the clip path (``Qt.UserRole``); bars are loaded on a pool
+    thread the first time a row is painted, so rows that are never scrolled
+    into view cost neither a widget nor a decode.
+    """
+
+    CACHE_SUFFIX = ".wf.npy"
+    PIXMAP_CACHE = 64  # rendered rows kept around for blitting
+    # Gradient colors for bars
+    _ACCENT = QtGui.QColor("#6366F1")
+    _ACCENT2 = QtGui.QColor("#4F46E5")
+    _HIGHLIGHT = QtGui.QColor("#818CF8")
+    _pool: typing.Optional[QtCore.QThreadPool] = None
+
+    def __init__(self, view: QtWidgets.QAbstractItemView):
+        super().__init__(view)
+        self._view = view
+        self._bars: typing.Dict[str, np.ndarray] = {}
+        self._pending: typing.Set[str] = set()
+        # (path, width, height, dpr) -> rendered bars; bars never change after load
+        self._pix: collections.OrderedDict = collections.OrderedDict()
+        self._notifier = _WaveformNotifier()
+        self._notifier.loaded.connect(self._on_loaded)
+
+    @classmethod
+    def cache_path(cls, audio_path: str) -> str:
+        """Sidecar file holding the precomputed bars for ``audio_path``."""
+        return audio_path + cls.CACHE_SUFFIX
+
+    @classmethod
+    def _loader_pool(cls) -> QtCore.QThreadPool:
+        """Shared pool for waveform decoding, kept small to avoid thrashing the disk."""
+        if cls._pool is None:
+            cls._pool = QtCore.QThreadPool()
+            cls._pool.setMaxThreadCount(max(1, (os.cpu_count() or 2) // 2))
+        return cls._pool
+
+    def forget(self, audio_path: str) -> None:
+        """Drop what is held for a deleted recording."""
+        self._bars.pop(audio_path, None)
+        for key in [k for k in self._pix if k[0] == audio_path]:
+            del self._pix[key]
+
+    @QtCore.Slot(str, object)
+    def _on_loaded(self, audio_path: str, samples: np.ndarray) -> None:
+        self._pending.discard(audio_path)
+        self._bars[audio_path] = samples
+        self._view.viewport().update()
+
+    @staticmethod
+    def _load_samples(audio_path: str) -> np.ndarray:
+        """Load bars from the sidecar cache, decoding the clip only when it is stale."""
+        cache = WaveformDelegate.cache_path(audio_path)
         try:
-            import soundfile as sf
-
-            data, rate = sf.read(self.audio_path)
-            if len(data.shape) > 1:
-                data = data[:, 0]  # mono
-            # Downsample to ~60 points for visualization
-            num_bars = 60
-            chunk_size = max(1, len(data) // num_bars)
-            samples = []
-            for i in range(0, len(data), chunk_size):
-                chunk = data[i : i + chunk_size]
-                if len(chunk) > 0:
-                    # RMS of chunk
-                    rms = float(np.sqrt(np.mean(np.square(chunk))))
-                    samples.append(rms)
-            if samples:
-                max_val = max(samples) if max(samples) > 0 else 1
-                samples = [s / max_val for s in samples]
-            return samples[:num_bars]
+            if os.path.getmtime(cache) >= os.path.getmtime(audio_path):
+                return np.load(cache).astype(np.float32)
         except Exception:
             pass
-        try:
-            import wave
+        samples = WaveformDelegate._decode_samples(audio_path)
+        WaveformDelegate.save_cache(audio_path, samples)
+        return samples
 
-            with wave.open(self.audio_path, "rb") as wf:
-                frames = wf.readframes(wf.getnframes())
-                data = (
-                    np.frombuffer(frames, dtype=np.int16).astype(np.float32) / 32768.0
+    @staticmethod
+    def save_cache(audio_path: str, samples: np.ndarray) -> None:
+        if len(samples):
+            try:
+                # float16 is plenty for bar heights
+                np.save(
+                    WaveformDelegate.cache_path(audio_path),
+                    np.asarray(samples, dtype=np.float16),
                 )
-                num_bars = 60
-                chunk_size = max(1, len(data) // num_bars)
-                samples = []
-                for i in range(0, len(data), chunk_size):
-                    chunk = data[i : i + chunk_size]
-                    if len(chunk) > 0:
-                        rms = float(np.sqrt(np.mean(np.square(chunk))))
-                        samples.append(rms)
-                if samples:
-                    max_val = max(samples) if max(samples) > 0 else 1
-                    samples = [s / max_val for s in samples]
-                return samples[:num_bars]
+            except Exception:
+                pass
+
+    @staticmethod
+    def bars_from_samples(data: np.ndarray, num_bars: int = 60) -> np.ndarray:
+        """Same bars as _decode_samples, from a clip that is still in memory."""
+        total = len(data)
+        if total <= 0:
+            return np.zeros(0, dtype=np.float32)
+        num_bars = min(num_bars, total)
+        edges = -(-np.arange(num_bars + 1, dtype=np.int64) * total // num_bars)
+        sumsq = np.add.reduceat(np.square(data, dtype=np.float64), edges[:-1])
+        bars = np.sqrt(sumsq / np.diff(edges)).astype(np.float32)
+        bars /= bars.max() + 1e-12
+        return bars
+
+    @staticmethod
+    def _decode_samples(
+        audio_path: str, num_bars: int = 60, blocksize: int = 65536
+    ) -> np.ndarray:
+        """Normalized RMS of ``num_bars`` equal slices of a clip (soundfile reads WAV too).
+
+        The file is streamed in blocks and each block's sum of squares is binned
+        straight into the target bars, so resident memory stays O(blocksize)
+        no matter how long the recording is.
+        """
+        try:
+            with sf.SoundFile(audio_path) as f:
+                total = f.frames
+                if total <= 0:
+                    return np.zeros(0, dtype=np.float32)
+                num_bars = min(num_bars, total)
+                # bar b covers samples [ceil(b*total/num_bars), ceil((b+1)*total/num_bars))
+                edges = -(-np.arange(num_bars + 1, dtype=np.int64) * total // num_bars)
+                sumsq = np.zeros(num_bars, dtype=np.float64)
+                pos = 0
+                for blk in f.blocks(blocksize, dtype="float32", always_2d=True):
+                    mono = blk[:, 0]  # mono
+                    idx = np.arange(pos, pos + len(mono), dtype=np.int64)
+                    idx *= num_bars
+                    idx //= total
+                    np.minimum(idx, num_bars - 1, out=idx)
+                    sumsq += np.bincount(idx, weights=mono * mono, minlength=num_bars)
+                    pos += len(mono)
+            bars = np.sqrt(sumsq / np.diff(edges)).astype(np.float32)
+            bars /= bars.max() + 1e-12
+            return bars
         except Exception:
-            return []
+            return np.zeros(0, dtype=np.float32)
+
+    def sizeHint(self, option, index) -> QtCore.QSize:
+        return QtCore.QSize(120, 32)
 
-    def paintEvent(self, event):
-        if not self.samples:
+    def paint(self, painter, option, index) -> None:
+        super().paint(painter, option, index)  # background / selection
+        path = index.data(QtCore.Qt.ItemDataRole.UserRole)
+        if not path:
+            return
+        rect = option.rect
+        samples = self._bars.get(path)
+        if samples is None:
+            if path not in self._pending:
+                self._pending.add(path)
+                self._loader_pool().start(_WaveformLoader(path, self._notifier))
+            # placeholder midline until the pool thread delivers the bars
+            painter.save()
+            painter.setPen(QtGui.QPen(QtGui.QColor(255, 255, 255, 40), 1))
+            mid = rect.top() + rect.height() // 2
+            painter.drawLine(rect.left(), mid, rect.right(), mid)
+            painter.restore()
             return
-        painter = QtGui.QPainter(self)
+        if len(samples) == 0:
+            return
+        dpr = painter.device().devicePixelRatioF()
+        key = (path, rect.width(), rect.height(), dpr)
+        pix = self._pix.get(key)
+        if pix is None:
+            pix = self._render_bars(samples, rect.size(), dpr)
+            self._pix[key] = pix
+            if len(self._pix) > self.PIXMAP_CACHE:
+                self._pix.popitem(last=False)
+        else:
+            self._pix.move_to_end(key)
+        painter.drawPixmap(rect.topLeft(), pix)
+
+    def _render_bars(
+        self, samples: np.ndarray, size: QtCore.QSize, dpr: float
+    ) -> QtGui.QPixmap:
+        """Draw the bars into a transparent pixmap of the given cell size."""
+        pix = QtGui.QPixmap(size * dpr)
+        pix.setDevicePixelRatio(dpr)
+        pix.fill(QtCore.Qt.GlobalColor.transparent)
+        painter = QtGui.QPainter(pix)
         painter.setRenderHint(QtGui.QPainter.RenderHint.Antialiasing)
 
-        w = self.width()
-        h = self.height()
-        bar_count = len(self.samples)
+        w = size.width()
+        h = size.height()
+        bar_count = len(samples)
         bar_width = max(2, (w - bar_count) / bar_count)
         spacing = 1
 
-        # Gradient colors for bars
-        accent = QtGui.QColor("#6366F1")
-        accent2 = QtGui.QColor("#4F46E5")
-        highlight = QtGui.QColor("#818CF8")
+        # One gradient for all bars; only its endpoints move per bar
+        grad = QtGui.QLinearGradient()
+        grad.setColorAt(0, self._HIGHLIGHT)
+        grad.setColorAt(0.5, self._ACCENT)
+        grad.setColorAt(1, self._ACCENT2)
+        painter.setPen(QtCore.Qt.PenStyle.NoPen)
 
-        for i, amp in enumerate(self.samples):
+        for i, amp in enumerate(samples):
             bar_height = max(2, int(amp * (h - 4)))
             x = int(i * (bar_width + spacing))
             y = (h - bar_height) // 2
 
-            # Create gradient for each bar
-            grad = QtGui.QLinearGradient(x, y, x, y + bar_height)
-            grad.setColorAt(0, highlight)
-            grad.setColorAt(0.5, accent)
-            grad.setColorAt(1, accent2)
-
+            grad.setStart(x, y)
+            grad.setFinalStop(x, y + bar_height)
             painter.setBrush(grad)
-            painter.setPen(QtCore.Qt.PenStyle.NoPen)
             painter.drawRoundedRect(
                 QtCore.QRectF(x, y, bar_width, bar_height), bar_width / 2, bar_width / 2
             )
 
         painter.end()
+        return pix
+
+
+class _WaveformNotifier(QtCore.QObject):
+    """Carries decoded bars from a pool thread back to the GUI thread."""
+
+    loaded = QtCore.Signal(str, object)
+
+
+class _WaveformLoader(QtCore.QRunnable):
+    """Pool task that decodes one clip's waveform bars."""
+
+    def __init__(self, audio_path: str, notifier: _WaveformNotifier):
+        super().__init__()
+        self.audio_path = audio_path
+        self.notifier = notifier
+
+    def run(self):
+        samples = WaveformDelegate._load_samples(self.audio_path)
+        try:
+            self.notifier.loaded.emit(self.audio_path, samples)
+        except RuntimeError:
+            pass  # table (and its notifier) already gone
 
 
 # ===================== translations =====================
-T = {
+_T = {
     "en": {
         "title": "Lino-ST",
         "tab_home": "Home",
@@ -692,7 +1096,7 @@ T = {
         "license": "License",
         "day": "Day",
         "sleep_duration": "Sleep Duration",
-        "days": ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"],
+        "days": ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"),
         "date_format": "Date Format",
         "date_format_eu": "EU (DD.MM.YYYY)",
         "date_format_us": "US (MM/DD/YYYY)",
@@ -702,6 +1106,7 @@ T = {
         "audio_format": "Audio Format",
         "audio_ogg": "OGG Vorbis (smaller files, recommended)",
         "audio_wav": "WAV (uncompressed, larger files)",
+        "block_size": "Audio Block Size",
         "help_text": "LINO-ST - SLEEP TRACKER\n\nHOW TO USE:\n\n1) Start = arm mic. Speak/clap to test.\n\n2) Auto-record saves clips only while level is above sensitivity.\n\n3) Sliders:\n   • Microphone Sensitivity: right = more sensitive, left = less.\n   • Max clip length: hard stop clip at this time (0 = unlimited).\n\n4) List below: Play/Stop to preview, Delete to remove.\n\n5) History shows past sleep sessions.\n\n6) Settings: Configure audio format (OGG/WAV), date/time format.\n\n\nHISTORY:\n- Day: day name.\n- Date: recording date.\n- Start/End: session times.\n- Sleep Duration: total hours/minutes (HH:MM).",
         "about_text": "<b>Lino-ST — Your Desktop Sleep Tracker</b><br><br>Version {version}<br>Created by Nele<br>License: MIT<br><br><b>Features</b><br>• Start/Stop microphone monitoring<br>• Auto-record when sound detected<br>• Live microphone meter<br>• Per-clip list with Play/Stop and Delete<br>• Language switcher (EN/HR/DE)<br>• Sleep session history<br>• Export recordings to ZIP<br>• Audio format selection (OGG/WAV)<br>• Modern dark UI with glossy effects<br>• EU/US date format support",
     },
@@ -726,7 +1131,7 @@ T = {
         "license": "Licenca",
         "day": "Dan",
         "sleep_duration": "Trajanje sna",
-        "days": ["Pon", "Uto", "Sri", "Čet", "Pet", "Sub", "Ned"],
+        "days": ("Pon", "Uto", "Sri", "Čet", "Pet", "Sub", "Ned"),
         "date_format": "Format datuma",
         "date_format_eu": "EU (DD.MM.YYYY)",
         "date_format_us": "US (MM/DD/YYYY)",
@@ -736,6 +1141,7 @@ T = {
         "audio_format": "Audio format",
         "audio_ogg": "OGG Vorbis (manje datoteke, preporučeno)",
         "audio_wav": "WAV (nekomprimirano, veće datoteke)",
+        "block_size": "Veličina audio bloka",
         "help_text": "LINO-ST - PRAĆENJE SPAVANJA\n\nKAKO KORISTITI:\n\n1) Start = aktiviraj mikrofon. Govori/pljeskaj za test.\n\n2) Automatski snima samo dok je razina iznad osjetljivosti.\n\n3) Klizači:\n   • Osjetljivost mikrofona: desno = osjetljivije, lijevo = manje.\n   • Maks. dužina klipa: automatski prekini nakon ovog vremena (0 = neograničeno).\n\n4) Lista ispod: Play/Stop za pregled, Obriši za brisanje.\n\n5) Povijest prikazuje prošle sesije spavanja.\n\n6) Postavke: Konfiguriraj audio format (OGG/WAV), format datuma/vremena.\n\n\nPOVIJEST:\n- Dan: naziv dana.\n- Datum: datum snimanja.\n- Početak/Kraj: vrijeme sesije.\n- Trajanje sna: ukupno sati/minuta (HH:MM).",
         "about_text": "<b>Lino-ST — Your Desktop Sleep Tracker</b><br><br>Verzija {version}<br>Autor: Nele<br>Licenca: MIT<br><br><b>Značajke</b><br>• Start/Stop praćenja mikrofona<br>• Automatsko snimanje kad se detektira zvuk<br>• Prikaz razine mikrofona uživo<br>• Lista snimki s Play/Stop i Obriši<br>• Odabir jezika (EN/HR/DE)<br>• Povijest sesija spavanja<br>• Export snimaka u ZIP<br>• Odabir audio formata (OGG/WAV)<br>• Moderni tamni UI sa glossy efektima<br>• EU/US format datuma",
     },
@@ -760,7 +1166,7 @@ T = {
         "license": "Lizenz",
         "day": "Tag",
         "sleep_duration": "Schlafdauer",
-        "days": ["Mo", "Di", "Mi", "Do", "Fr", "Sa", "So"],
+        "days": ("Mo", "Di", "Mi", "Do", "Fr", "Sa", "So"),
         "date_format": "Datumsformat",
         "date_format_eu": "EU (TT.MM.JJJJ)",
         "date_format_us": "US (MM/TT/JJJJ)",
@@ -770,87 +1176,551 @@ T = {
         "audio_format": "Audio-Format",
         "audio_ogg": "OGG Vorbis (kleinere Dateien, empfohlen)",
         "audio_wav": "WAV (unkomprimiert, größere Dateien)",
+        "block_size": "Audio-Blockgröße",
         "help_text": "LINO-ST - SCHLAF-TRACKER\n\nANLEITUNG:\n\n1) Start = Mikrofon aktivieren. Sprechen/Klatschen zum Testen.\n\n2) Automatische Aufnahme nur wenn Pegel über Empfindlichkeit.\n\n3) Regler:\n   • Mikrofon-Empfindlichkeit: rechts = empfindlicher, links = weniger.\n   • Max. Clip-Länge: Aufnahme nach dieser Zeit stoppen (0 = unbegrenzt).\n\n4) Liste unten: Play/Stop zur Vorschau, Löschen zum Entfernen.\n\n5) Verlauf zeigt vergangene Schlafsitzungen.\n\n6) Einstellungen: Audio-Format (OGG/WAV), Datum/Zeit-Format konfigurieren.\n\n\nVERLAUF:\n- Tag: Wochentag.\n- Datum: Aufnahmedatum.\n- Start/Ende: Sitzungszeiten.\n- Schlafdauer: Gesamtstunden/Minuten (HH:MM).",
         "about_text": "<b>Lino-ST — Your Desktop Sleep Tracker</b><br><br>Version {version}<br>Erstellt von Nele<br>Lizenz: MIT<br><br><b>Funktionen</b><br>• Start/Stop Mikrofonüberwachung<br>• Automatische Aufnahme bei Geräusch<br>• Live-Mikrofonpegel<br>• Clip-Liste mit Play/Stop und Löschen<br>• Sprachwechsel (EN/HR/DE)<br>• Schlaf-Sitzungsverlauf<br>• Export der Aufnahmen als ZIP<br>• Audio-Format-Auswahl (OGG/WAV)<br>• Moderne dunkle UI mit Glanz-Effekten<br>• EU/US Datumsformat",
     },
 }
+# read-only per-language views; widgets look strings up via SleepTracker.tr
+T = {lang: types.MappingProxyType(d) for lang, d in _T.items()}
+
+
+# ===================== audio processing thread =====================
+class BlockRing:
+    """Lock-free single-producer/single-consumer ring of float32 audio blocks.
+
+    Only the audio callback advances ``_w`` and only the consumer advances
+    ``_r``; each index is published with a single attribute store, so neither
+    side ever takes a lock. When the ring is full the producer drops the new
+    block (counted in ``overruns``) rather than overwrite unread data.
+
+    After publishing, the producer sets ``ready`` so the consumer can sleep
+    until audio arrives instead of polling.
+    """
+
+    def __init__(self, slots: int, block: int):
+        self.slots = slots
+        self.buf = np.empty((slots, block), dtype=np.float32)
+        self.lens = np.zeros(slots, dtype=np.int64)
+        self.ready = threading.Event()
+        self._w = 0
+        self._r = 0
+        self.overruns = 0
+
+    def reset(self) -> None:
+        """Forget everything; only call while no stream is running."""
+        self._w = self._r = 0
+        self.overruns = 0
+        self.ready.clear()
+
+    def write(self, samples: np.ndarray) -> None:
+        """Producer side: copy one block in and publish it."""
+        w = self._w
+        if w - self._r >= self.slots:
+            self.overruns += 1
+            return
+        slot = w % self.slots
+        n = min(len(samples), self.buf.shape[1])
+        np.copyto(self.buf[slot, :n], samples[:n])
+        self.lens[slot] = n
+        self._w = w + 1
+        if not self.ready.is_set():
+            self.ready.set()
+
+    def readable(self) -> tuple:
+        """Consumer side: ``(first, end)`` sequence numbers ready to read."""
+        return self._r, self._w
+
+    def block(self, seq: int) -> np.ndarray:
+        """View of block ``seq``; valid until it is released."""
+        slot = seq % self.slots
+        return self.buf[slot, : self.lens[slot]]
+
+    def span(self, seq: int, end: int) -> tuple:
+        """Slots ``seq``.. that are contiguous in ``buf`` (stops at the wrap point).
+
+        Returns ``(blocks, full)``: a 2-D view of the slots and whether every one
+        of them holds a complete block.
+        """
+        slot = seq % self.slots
+        stop = slot + min(end - seq, self.slots - slot)
+        full = bool((self.lens[slot:stop] == self.buf.shape[1]).all())
+        return self.buf[slot:stop], full
+
+    def release(self, end: int) -> None:
+        """Consumer side: hand slots before ``end`` back to the producer."""
+        self._r = end
+
+
+class AudioProcessor(QtCore.QThread):
+    """Drains the callback ring and runs detection/segmentation off the GUI thread.
+
+    All segmentation state (detector state, preroll, current capture) lives here;
+    the GUI only receives throttled ``levels`` and the tracker's ``clipSaved``.
+    """
+
+    levels = QtCore.Signal(float, float, int)  # meter dB, smoothed dB, bar %
+
+    METER_MS = 50
+    BATCH_MIN = 4  # queued blocks at which detection switches to _detect_batch
+
+    def __init__(self, tracker: "SleepTracker"):
+        super().__init__()
+        self._tracker = tracker
+        self._stop = threading.Event()
+        self._meter_samples = tracker.RATE * self.METER_MS // 1000
+        self._accum_sumsq: float = 0.0
+        self._accum_n: int = 0
+        # detector state, see _detect: [smooth_db, above_ms, below_ms]
+        self.state = np.array([-90.0, 0.0, 0.0], dtype=np.float32)
+        # the EMA steps once per block: rescale alpha to the configured block size
+        # so the smoothing time constant doesn't change with the latency setting
+        self.alpha = 1.0 - (1.0 - tracker.EMA_ALPHA) ** (
+            tracker.block_size / tracker.EMA_BLOCK
+        )
+        self._batch_out = np.empty((tracker._ring.slots, 4), dtype=np.float32)
+        # preroll as a sample ring; once full the oldest sample sits at _pre_pos
+        pre_blocks = int(tracker.PREROLL_MS / 1000 * tracker.RATE / tracker.block_size)
+        self._pre_buf = np.empty((pre_blocks + 4) * tracker.block_size, np.float32)
+        self._pre_pos = 0
+        self._pre_len = 0
+        # capture buffer with a write cursor: finalizing a clip is a slice, no concat.
+        # Two of them alternate, so a finished clip goes to the writer as a view
+        # while the next one is captured into the other buffer.
+        self.capturing = False
+        cap = self._cap_capacity()
+        self._cap_bufs = [np.empty(cap, np.float32), np.empty(cap, np.float32)]
+        self._cap_busy: list = [None, None]  # writer future still reading each
+        self._cap_idx = 0
+        self._cap_buf = self._cap_bufs[0]
+        self._cap_pos = 0
+        # a clip that outgrows _cap_buf is streamed to disk through _spill
+        self._spill: typing.Optional[_ClipStream] = None
+        self._cap_spilled = 0
+
+    def run(self) -> None:
+        try:
+            prio = os.sched_get_priority_min(os.SCHED_RR)
+            os.sched_setscheduler(0, os.SCHED_RR, os.sched_param(prio))
+        except (AttributeError, OSError):
+            pass  # needs rtprio/CAP_SYS_NICE; the QThread priority still applies
+        ready = self._tracker._ring.ready
+        while True:
+            ready.wait()
+            # clear before draining: a block published meanwhile sets it again
+            ready.clear()
+            if self._stop.is_set():
+                break
+            self._drain()
+        self._drain()
+        self._finalize_clip(force=True)
+
+    def stop(self) -> None:
+        """Stop after draining the ring and saving any clip still in progress."""
+        self._stop.set()
+        self._tracker._ring.ready.set()
+        self.wait()
+
+    def _drain(self) -> None:
+        """Process every published block in batches, one release per batch."""
+        t = self._tracker
+        ring = t._ring
+        state, alpha, rate, eps = self.state, self.alpha, t.RATE, t.EPS
+        while True:
+            start, end = ring.readable()
+            if start == end:
+                return
+            threshold_db = t.threshold_db
+            monitoring = t.monitoring
+            seq = start
+            while seq < end:
+                blocks, full = ring.span(seq, end)
+                if full and len(blocks) >= self.BATCH_MIN:
+                    # catching up after a stall: one kernel call for the whole run
+                    seq += self._run_batch(blocks, threshold_db, monitoring)
+                    continue
+                block = ring.block(seq)
+                n = len(block)
+                rms = _detect(block, state, alpha, threshold_db, rate, eps)
+                self._accum_sumsq += rms * rms * n
+                self._accum_n += n
+                if self._accum_n >= self._meter_samples:
+                    self._emit_levels(eps)
+                if monitoring:
+                    self._segment_block(block, state)
+                seq += 1
+            ring.release(end)
+
+    def _run_batch(
+        self, blocks: np.ndarray, threshold_db: float, monitoring: bool
+    ) -> int:
+        """Detect and segment a run of full blocks; returns how many were consumed."""
+        t = self._tracker
+        k, n = blocks.shape
+        out = self._batch_out[:k]
+        _detect_batch(blocks, self.state, self.alpha, threshold_db, t.RATE, t.EPS, out)
+        done = k
+        if monitoring:
+            for i in range(k):
+                if self._segment_block(blocks[i], out[i, 1:]):
+                    # the clip ended here and its counters were reset; the
+                    # remaining rows were computed without that, so redo them
+                    self.state[:] = out[i, 1:]
+                    self.state[_DET_ABOVE:] = 0.0
+                    done = i + 1
+                    break
+        rms = out[:done, 0]
+        self._accum_sumsq += float(np.dot(rms, rms)) * n
+        self._accum_n += done * n
+        if self._accum_n >= self._meter_samples:
+            self._emit_levels(t.EPS)
+        return done
+
+    def _emit_levels(self, eps: float) -> None:
+        db = 20.0 * math.log10(math.sqrt(self._accum_sumsq / self._accum_n) + eps)
+        self._accum_sumsq = 0.0
+        self._accum_n = 0
+        pct = max(0, min(100, int((db + 60) * (100.0 / 60.0))))
+        self.levels.emit(db, float(self.state[_DET_EMA]), pct)
+
+    def _preroll_write(self, block: np.ndarray) -> None:
+        """Copy a ring slot into the preroll ring, overwriting the oldest samples."""
+        buf = self._pre_buf
+        size = len(buf)
+        n = len(block)
+        if n >= size:
+            buf[:] = block[n - size :]
+            self._pre_pos = 0
+            self._pre_len = size
+            return
+        pos = self._pre_pos
+        end = pos + n
+        if end <= size:
+            buf[pos:end] = block
+        else:
+            split = size - pos
+            buf[pos:] = block[:split]
+            buf[: n - split] = block[split:]
+        self._pre_pos = end % size
+        self._pre_len = min(size, self._pre_len + n)
+
+    def _segment_block(self, block: np.ndarray, state: np.ndarray) -> bool:
+        """Run the arm/hang/hysteresis state machine for one ring slot.
+
+        ``state`` is the detector state after this block. Returns True when the
+        block ended a clip.
+        """
+        t = self._tracker
+        stop_th = t.threshold_db - 6.0  # hystereza
+        # copy out: the preroll keeps the samples after the slot is reused
+        self._preroll_write(block)
+
+        act = _hyst_step(state, self.capturing, t.ARM_MS, t.HANG_MS, stop_th)
+        if not self.capturing:
+            if not act & _HYST_ARM:
+                return False
+            self._start_capture()  # the preroll already ends with this block
+        else:
+            self._capture(block)
+        captured = self._cap_spilled + self._cap_pos
+        hit_max = t.max_len_s > 0 and (captured / t.RATE) >= t.max_len_s
+        if act & _HYST_STOP or hit_max:
+            self._finalize_clip()
+            return True
+        return False
+
+    def _cap_capacity(self) -> int:
+        """Samples a clip can reach at the current max length (60 s if unlimited)."""
+        t = self._tracker
+        return (t.max_len_s or 60) * t.RATE + len(self._pre_buf)
+
+    def _capture(self, samples: np.ndarray) -> None:
+        pos = self._cap_pos
+        end = pos + len(samples)
+        if end > len(self._cap_buf):
+            # unlimited clip, or max length raised mid-capture: stream what we
+            # have to disk and start over, so memory stays at one buffer
+            self._spill_capture()
+            pos, end = 0, len(samples)
+        self._cap_buf[pos:end] = samples
+        self._cap_pos = end
+
+    def _spill_capture(self) -> None:
+        t = self._tracker
+        if self._spill is None:
+            self._spill = _ClipStream(t, t.audio_format)
+            t._writer.submit(self._spill.open).add_done_callback(t._clip_written)
+        n = self._cap_pos
+        self._hand_off(n, self._spill.write)
+        self._cap_spilled += n
+        self._cap_pos = 0
+
+    def _hand_off(self, n: int, fn, *args) -> None:
+        """Queue ``fn(view of the first n captured samples, *args)`` on the writer
+        and switch capture over to the other buffer."""
+        t = self._tracker
+        fut = t._writer.submit(fn, self._cap_buf[:n], *args)
+        fut.add_done_callback(t._clip_written)
+        i = self._cap_idx
+        self._cap_busy[i] = fut
+        i ^= 1
+        busy = self._cap_busy[i]
+        if busy is not None and not busy.done():
+            # the writer is still on the clip before that one; never wait for it
+            # here, the queued task keeps the old array alive until it is done
+            self._cap_bufs[i] = np.empty_like(self._cap_bufs[i])
+        self._cap_busy[i] = None
+        self._cap_idx = i
+        self._cap_buf = self._cap_bufs[i]
+
+    def _start_capture(self) -> None:
+        self.capturing = True
+        # max length may have been raised since the last clip: size for it up
+        # front so the whole clip lands in one buffer without spilling to disk
+        need = self._cap_capacity()
+        if len(self._cap_buf) < need:
+            self._cap_buf = np.empty(need, dtype=np.float32)
+            self._cap_bufs[self._cap_idx] = self._cap_buf
+        # unroll the preroll ring oldest-first: at most two contiguous copies.
+        # _pre_len already counts its samples and the buffer always has room
+        # for a full preroll, so there is nothing to sum or bounds-check.
+        buf, pos, n = self._pre_buf, self._pre_pos, self._pre_len
+        cap = self._cap_buf
+        if n == len(buf):
+            head = n - pos
+            cap[:head] = buf[pos:]
+            cap[head:n] = buf[:pos]
+        else:
+            cap[:n] = buf[:pos]  # not wrapped yet: the samples are [0, pos)
+        self._cap_pos = n
+        self._pre_pos = 0
+        self._pre_len = 0
+
+    def _finalize_clip(self, force: bool = False) -> None:
+        if not self.capturing and not force:
+            return
+        n = self._cap_pos if self.capturing else 0
+        self.capturing = False
+        self._cap_pos = 0
+        self.state[_DET_ABOVE:] = 0.0
+        stamp = datetime.datetime.now()
+        if self._spill is not None:
+            # long clip: the head is already on disk, append the tail and close
+            spill, self._spill = self._spill, None
+            self._cap_spilled = 0
+            self._hand_off(n, spill.close, stamp)
+        elif n:
+            self._hand_off(
+                n, self._tracker._write_clip, stamp, self._tracker.audio_format
+            )
+
+
+class _ClipStream:
+    """Incremental encoder for a clip too long for the capture buffer.
+
+    Every method runs on the tracker's writer thread, in submission order. The
+    file is written under a ``.part`` name and renamed on close, using the
+    stamp taken when the clip ended, like clips written in one go.
+    """
+
+    def __init__(self, tracker: "SleepTracker", audio_format: str):
+        self._tracker = tracker
+        self._format = audio_format
+        self._file: typing.Optional[sf.SoundFile] = None
+        self._tmp = ""
+        self._ext = ""
+        self.frames = 0
+
+    def open(self) -> None:
+        t = self._tracker
+        os.makedirs(t.out_dir, exist_ok=True)  # see _write_clip
+        base = os.path.join(
+            t.out_dir, datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+        )
+        if self._format == "ogg":
+            try:
+                self._tmp = base + ".ogg.part"
+                self._file = sf.SoundFile(
+                    self._tmp, "w", t.RATE, t.CH, format="OGG", subtype="VORBIS"
+                )
+                self._ext = ".ogg"
+                return
+            except Exception:
+                pass  # fall back to WAV, like _write_clip
+        self._tmp = base + ".wav.part"
+        self._file = sf.SoundFile(
+            self._tmp, "w", t.RATE, t.CH, format="WAV", subtype="PCM_16"
+        )
+        self._ext = ".wav"
+
+    def write(self, data: np.ndarray) -> None:
+        if self._file is None:
+            return  # open failed; already reported
+        if self._ext == ".wav":
+            data = self._tracker._to_int16(data)  # same scaling as one-shot WAVs
+        _sf_write(self._file, data)
+        self.frames += len(data)
+
+    def close(self, tail: np.ndarray, stamp: datetime.datetime) -> None:
+        if self._file is None:
+            return
+        t = self._tracker
+        self.write(tail)
+        self._file.close()
+        self._file = None
+        path = t._clip_path(stamp, self._ext)
+        os.replace(self._tmp, path)
+        # no bars from memory here; the waveform loader decodes it once
+        t.clipSaved.emit(path, self.frames / t.RATE)
+
+
+class _ZipWorker(QtCore.QThread):
+    """Writes the recordings export archive off the GUI thread."""
+
+    progress = QtCore.Signal(int)  # files done
+
+    def __init__(self, path: str, files: list, parent=None):
+        super().__init__(parent)
+        self.path = path
+        self.files = files
+        self.written = 0
+        self.error: typing.Optional[Exception] = None
+        # isInterruptionRequested() reads False again once the thread is done
+        self.canceled = False
+
+    def run(self) -> None:
+        import zipfile
+
+        try:
+            with zipfile.ZipFile(
+                self.path, "w", zipfile.ZIP_DEFLATED, compresslevel=1
+            ) as zf:
+                for i, fpath in enumerate(self.files):
+                    if self.isInterruptionRequested():
+                        self.canceled = True
+                        break
+                    if os.path.exists(fpath):
+                        # compressed formats don't shrink any further: store them
+                        ext = os.path.splitext(fpath)[1].lower()
+                        stored = ext in (".ogg", ".mp3", ".flac")
+                        # zipfile streams from the file, nothing is read whole
+                        zf.write(
+                            fpath,
+                            os.path.basename(fpath),
+                            compress_type=zipfile.ZIP_STORED if stored else None,
+                        )
+                        self.written += 1
+                    self.progress.emit(i + 1)
+        except Exception as e:
+            self.error = e
+        if self.error is not None or self.canceled:
+            try:
+                os.remove(self.path)  # don't leave a partial archive behind
+            except OSError:
+                pass
 
 
 # ===================== main window =====================
 
 
 class SleepTracker(QtWidgets.QWidget):
+    # emitted by _write_clip, from the writer thread
+    clipSaved = QtCore.Signal(str, float)
+    # emitted by _clip_written when a writer task raised, also from that thread
+    clipFailed = QtCore.Signal(str)
+
     RATE = 44100
     CH = 1
     EPS = 1e-8
     ARM_MS = 120
     HANG_MS = 400
     PREROLL_MS = 250
-    BLOCK = 1024
-    EMA_ALPHA = 0.4
+    BLOCK = 256  # default frames per callback (~5.8 ms)
+    DURATIONS_FILE = ".durations.json"  # duration probe cache, kept in out_dir
+    BLOCK_SIZES = (128, 256, 512)  # latency vs. XRun-risk choices in Settings
+    RING_MS = 2000  # audio the ring can hold while the processor is busy
+    EMA_ALPHA = 0.4  # detector smoothing per EMA_BLOCK frames (tau ~45 ms)
+    EMA_BLOCK = 1024
 
     def __init__(self) -> None:
         super().__init__()
         self.setObjectName("root")
         self.lang = "en"
+        self.tr = T[self.lang].__getitem__
         self.date_format = "eu"  # "eu" = DD.MM.YYYY, "us" = MM/DD/YYYY
         self.time_format = "24"  # "24" = 24h, "12" = 12h AM/PM
         self.audio_format = (
             "ogg"  # "ogg" = OGG Vorbis (smaller), "wav" = WAV (uncompressed)
         )
         self.theme_palette: typing.Optional[dict] = None
+        self._fg_color = "#fff"  # theme_palette["fg"], refreshed by apply_theme
 
         # audio state
-        self.stream: typing.Optional[sd.InputStream] = None
-        self.q: "queue.Queue[np.ndarray]" = queue.Queue()
+        self.stream: typing.Optional["sd.RawInputStream"] = None
+        self.block_size: int = self.BLOCK
+        self.processor: typing.Optional[AudioProcessor] = None
         self.monitoring: bool = False
         self.threshold_db: int = -45  # Will be set by slider
         self._sens_pct: int = 62  # ~62% = -45dB (default)
         self.max_len_s: int = 30  # seconds (0 = unlimited)
-        self.capture_samples: int = 0
-        self.smooth_db: float = -90.0
-
-        # segmentation
-        self.capturing: bool = False
-        self.capture_frames: list[np.ndarray] = []
-        self.above_ms: float = 0.0
-        self.below_ms: float = 0.0
-        self.preroll = collections.deque(
-            maxlen=int(self.PREROLL_MS / 1000 * self.RATE / self.BLOCK + 4)
+        # warm the level detector so the first audio block doesn't pay for it
+        _detect(
+            np.zeros(self.BLOCK, dtype=np.float32),
+            np.zeros(3, dtype=np.float32),
+            self.EMA_ALPHA,
+            self.threshold_db,
+            self.RATE,
+            self.EPS,
+        )
+        self._alloc_audio_buffers()
+        # clips are encoded off the processing thread, one at a time and in order
+        self._writer = concurrent.futures.ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="clip-writer"
         )
+        # int16 conversion scratch for WAV clips, grown on demand (see _to_int16)
+        self._f32_scratch = np.empty(0, dtype=np.float32)
+        self._i16_scratch = np.empty(0, dtype=np.int16)
 
         # storage
         self.out_dir = os.path.join(APP_DIR, "recordings")
-        os.makedirs(self.out_dir, exist_ok=True)
+        _ensure_dir(self.out_dir)
         cfg_dir = os.path.join(os.path.expanduser("~"), ".config", "Lino-ST")
-        os.makedirs(cfg_dir, exist_ok=True)
-        self.sessions_file = os.path.join(cfg_dir, "sessions.json")
-        legacy = os.path.join(APP_DIR, "sessions.json")
-        try:
-            if os.path.exists(legacy) and not os.path.exists(self.sessions_file):
-                import shutil as _sh
-
-                _sh.copy2(legacy, self.sessions_file)
-        except Exception:
-            pass
+        _ensure_dir(cfg_dir)
+        # one JSON record per line, so a new session is a single append
+        self.sessions_file = os.path.join(cfg_dir, "sessions.jsonl")
+        if not os.path.exists(self.sessions_file):
+            self._migrate_sessions(
+                os.path.join(cfg_dir, "sessions.json"),
+                os.path.join(APP_DIR, "sessions.json"),
+            )
         self.sessions = self._load_sessions()
-        self.session_start: typing.Optional[QtCore.QDateTime] = None
+        self.session_start: typing.Optional[datetime.datetime] = None
+        self._session_start_mono = 0.0  # time.monotonic() at Start, for the duration
 
         # playback state
         self.current_play: typing.Optional[tuple] = None  # (weakref(btn), path)
+        self._zip_export: typing.Optional[tuple] = None  # (_ZipWorker, dialog)
         self.player = QMediaPlayer(self)
         self.audio_out = QAudioOutput(self)
         self.player.setAudioOutput(self.audio_out)
         self.audio_out.setVolume(1.0)
         self.player.playbackStateChanged.connect(self._on_player_state)
 
+        # language/format changes arriving together rebuild the tables only once
+        self._refresh_pending = QtCore.QTimer(self)
+        self._refresh_pending.setSingleShot(True)
+        self._refresh_pending.setInterval(0)
+        self._refresh_pending.timeout.connect(self._do_refresh_all)
+
         # ui
         self._build_ui()
         self.setWindowIcon(icon_app(64))
 
         self.apply_theme()
         self._load_existing_recordings()
-        self._wire_timers()
+        self.clipSaved.connect(self._add_row)
+        self._clip_error_open = False
+        self.clipFailed.connect(self._on_clip_failed)
 
         # System tray icon
         self.tray = QtWidgets.QSystemTrayIcon(icon_app(32), self)
@@ -874,14 +1744,14 @@ class SleepTracker(QtWidgets.QWidget):
 
     # ---- UI ----
     def _build_ui(self) -> None:
-        self.setWindowTitle(T[self.lang]["title"])
+        self.setWindowTitle(self.tr("title"))
         self.resize(800, 800)
         outer = QtWidgets.QVBoxLayout(self)
         outer.setContentsMargins(16, 16, 16, 16)
         outer.setSpacing(10)
 
         header = QtWidgets.QHBoxLayout()
-        title = QtWidgets.QLabel(T[self.lang]["title"])
+        title = QtWidgets.QLabel(self.tr("title"))
         title.setStyleSheet("font-size:20px; font-weight:600;")
         header.addWidget(title)
         header.addStretch(1)
@@ -903,7 +1773,7 @@ class SleepTracker(QtWidgets.QWidget):
         cg.setContentsMargins(16, 16, 16, 16)
         cg.setVerticalSpacing(10)
 
-        self.btnStart = QtWidgets.QPushButton(T[self.lang]["start"])
+        self.btnStart = QtWidgets.QPushButton(self.tr("start"))
         self.btnStart.setProperty("variant", "pill")
         self.btnStart.setIcon(icon_play(22))
         self.btnStart.setIconSize(QtCore.QSize(22, 22))
@@ -931,23 +1801,30 @@ class SleepTracker(QtWidgets.QWidget):
 
         # Sensitivity: 0-100%, maps to threshold -20dB (0%) to -60dB (100%)
         self._sens_pct = self._threshold_to_pct(self.threshold_db)
-        self.lblSens = QtWidgets.QLabel(
-            f"{T[self.lang]['sensitivity']} ({self._sens_pct}%)"
-        )
+        self.lblSens = QtWidgets.QLabel(f"{self.tr('sensitivity')} ({self._sens_pct}%)")
         self.sens = QtWidgets.QSlider(QtCore.Qt.Orientation.Horizontal)
         self.sens.setRange(0, 100)
         self.sens.setValue(self._sens_pct)
         self.sens.setToolTip("Left = less sensitive; Right = more sensitive")
         self.sens.valueChanged.connect(self._sens_changed)
+        # the detector only picks up the value once the slider settles
+        self._sens_commit_timer = QtCore.QTimer(self)
+        self._sens_commit_timer.setSingleShot(True)
+        self._sens_commit_timer.setInterval(100)
+        self._sens_commit_timer.timeout.connect(self._commit_sens)
         s.addWidget(self.lblSens, 0, 0)
         s.addWidget(self.sens, 0, 1)
 
-        self.lblMax = QtWidgets.QLabel(f"{T[self.lang]['maxlen']} ({self.max_len_s} s)")
+        self.lblMax = QtWidgets.QLabel(f"{self.tr('maxlen')} ({self.max_len_s} s)")
         self.maxlen = QtWidgets.QSlider(QtCore.Qt.Orientation.Horizontal)
         self.maxlen.setRange(0, 60)
         self.maxlen.setValue(self.max_len_s)
         self.maxlen.setToolTip("0 = unlimited")
         self.maxlen.valueChanged.connect(self._maxlen_changed)
+        self._maxlen_commit_timer = QtCore.QTimer(self)
+        self._maxlen_commit_timer.setSingleShot(True)
+        self._maxlen_commit_timer.setInterval(100)
+        self._maxlen_commit_timer.timeout.connect(self._commit_maxlen)
         s.addWidget(self.lblMax, 1, 0)
         s.addWidget(self.maxlen, 1, 1)
 
@@ -974,35 +1851,28 @@ class SleepTracker(QtWidgets.QWidget):
             QtWidgets.QAbstractItemView.ScrollMode.ScrollPerPixel
         )
         self.table.setAlternatingRowColors(True)
+        self._wave_delegate = WaveformDelegate(self.table)
+        self.table.setItemDelegateForColumn(4, self._wave_delegate)
         self.table.setShowGrid(True)
         self.table.setHorizontalHeaderLabels(
             [
-                T[self.lang]["date"],
-                T[self.lang]["time"],
-                T[self.lang]["length"],
-                T[self.lang]["playstop"],
+                self.tr("date"),
+                self.tr("time"),
+                self.tr("length"),
+                self.tr("playstop"),
                 "Waveform",
-                T[self.lang]["delete"],
+                self.tr("delete"),
             ]
         )
-        self.table.horizontalHeader().setSectionResizeMode(
-            0, QtWidgets.QHeaderView.ResizeMode.ResizeToContents
-        )
-        self.table.horizontalHeader().setSectionResizeMode(
-            1, QtWidgets.QHeaderView.ResizeMode.ResizeToContents
-        )
-        self.table.horizontalHeader().setSectionResizeMode(
-            2, QtWidgets.QHeaderView.ResizeMode.ResizeToContents
-        )
-        self.table.horizontalHeader().setSectionResizeMode(
-            3, QtWidgets.QHeaderView.ResizeMode.ResizeToContents
-        )
-        self.table.horizontalHeader().setSectionResizeMode(
-            4, QtWidgets.QHeaderView.ResizeMode.Stretch
-        )
-        self.table.horizontalHeader().setSectionResizeMode(
-            5, QtWidgets.QHeaderView.ResizeMode.ResizeToContents
-        )
+        fit = QtWidgets.QHeaderView.ResizeMode.ResizeToContents
+        h = self.table.horizontalHeader()
+        # nothing listens yet; don't emit a resize notification per column
+        h.blockSignals(True)
+        for col, mode in enumerate(
+            (fit, fit, fit, fit, QtWidgets.QHeaderView.ResizeMode.Stretch, fit)
+        ):
+            h.setSectionResizeMode(col, mode)
+        h.blockSignals(False)
         self.table.verticalHeader().setVisible(False)
         self.table.verticalHeader().setDefaultSectionSize(48)
         self.table.setSelectionBehavior(
@@ -1017,9 +1887,37 @@ class SleepTracker(QtWidgets.QWidget):
 
         g.addWidget(self.card, 0, 0, 1, 1)
         g.addWidget(self.recCard, 1, 0, 1, 1)
-        self.tabs.addTab(home, T[self.lang]["tab_home"])
+        self.tabs.addTab(home, self.tr("tab_home"))
 
-        # -- History tab --
+        # History/Settings/About are built on first visit (see _ensure_tab_built)
+        self._tab_builders = {
+            1: self._build_history_tab,
+            2: self._build_settings_tab,
+            3: self._build_about_tab,
+        }
+        self._tab_built = [True, False, False, False]
+        for key in ("tab_hist", "tab_settings", "tab_about"):
+            self.tabs.addTab(QtWidgets.QWidget(), self.tr(key))
+        self.tabs.currentChanged.connect(self._ensure_tab_built)
+
+    def _ensure_tab_built(self, idx: int) -> None:
+        """Swap the placeholder at ``idx`` for the real tab the first time it is shown."""
+        if idx < 0 or self._tab_built[idx]:
+            return
+        self._tab_built[idx] = True
+        page = self._tab_builders[idx]()
+        placeholder = self.tabs.widget(idx)
+        title = self.tabs.tabText(idx)
+        self.tabs.blockSignals(True)
+        try:
+            self.tabs.removeTab(idx)
+            self.tabs.insertTab(idx, page, title)
+            self.tabs.setCurrentIndex(idx)
+        finally:
+            self.tabs.blockSignals(False)
+        placeholder.deleteLater()
+
+    def _build_history_tab(self) -> QtWidgets.QWidget:
         hist = QtWidgets.QWidget()
         hv = QtWidgets.QVBoxLayout(hist)
         hv.setSpacing(10)
@@ -1045,11 +1943,11 @@ class SleepTracker(QtWidgets.QWidget):
         self.sessionTable.setShowGrid(True)
         self.sessionTable.setHorizontalHeaderLabels(
             [
-                T[self.lang]["day"],
-                T[self.lang]["date"],
+                self.tr("day"),
+                self.tr("date"),
                 "Start",
                 "End",
-                T[self.lang]["sleep_duration"],
+                self.tr("sleep_duration"),
             ]
         )
         self.sessionTable.horizontalHeader().setStretchLastSection(True)
@@ -1062,9 +1960,11 @@ class SleepTracker(QtWidgets.QWidget):
         )
         hv2.addWidget(self.sessionTable)
         hv.addWidget(self.histCard)
-        self.tabs.addTab(hist, T[self.lang]["tab_hist"])
+        self._apply_header_styles()
+        self._refresh_history()
+        return hist
 
-        # -- Settings tab --
+    def _build_settings_tab(self) -> QtWidgets.QWidget:
         settings = QtWidgets.QWidget()
         sv = QtWidgets.QVBoxLayout(settings)
         sv.setSpacing(10)
@@ -1077,7 +1977,7 @@ class SleepTracker(QtWidgets.QWidget):
 
         # Language setting
         langRow = QtWidgets.QHBoxLayout()
-        self.lblLang = QtWidgets.QLabel(T[self.lang]["language"] + ":")
+        self.lblLang = QtWidgets.QLabel(self.tr("language") + ":")
         self.langCombo = QtWidgets.QComboBox()
         self.langCombo.addItems(["English", "Hrvatski", "Deutsch"])
         self.langCombo.currentIndexChanged.connect(self._lang_changed)
@@ -1088,10 +1988,10 @@ class SleepTracker(QtWidgets.QWidget):
 
         # Date format setting
         dateRow = QtWidgets.QHBoxLayout()
-        self.lblDateFmt = QtWidgets.QLabel(T[self.lang]["date_format"] + ":")
+        self.lblDateFmt = QtWidgets.QLabel(self.tr("date_format") + ":")
         self.dateFormatCombo = QtWidgets.QComboBox()
         self.dateFormatCombo.addItems(
-            [T[self.lang]["date_format_eu"], T[self.lang]["date_format_us"]]
+            [self.tr("date_format_eu"), self.tr("date_format_us")]
         )
         self.dateFormatCombo.currentIndexChanged.connect(self._date_format_changed)
         dateRow.addWidget(self.lblDateFmt)
@@ -1101,10 +2001,10 @@ class SleepTracker(QtWidgets.QWidget):
 
         # Time format setting
         timeRow = QtWidgets.QHBoxLayout()
-        self.lblTimeFmt = QtWidgets.QLabel(T[self.lang]["time_format"] + ":")
+        self.lblTimeFmt = QtWidgets.QLabel(self.tr("time_format") + ":")
         self.timeFormatCombo = QtWidgets.QComboBox()
         self.timeFormatCombo.addItems(
-            [T[self.lang]["time_format_24"], T[self.lang]["time_format_12"]]
+            [self.tr("time_format_24"), self.tr("time_format_12")]
         )
         self.timeFormatCombo.currentIndexChanged.connect(self._time_format_changed)
         timeRow.addWidget(self.lblTimeFmt)
@@ -1114,11 +2014,9 @@ class SleepTracker(QtWidgets.QWidget):
 
         # Audio format setting
         audioRow = QtWidgets.QHBoxLayout()
-        self.lblAudioFmt = QtWidgets.QLabel(T[self.lang]["audio_format"] + ":")
+        self.lblAudioFmt = QtWidgets.QLabel(self.tr("audio_format") + ":")
         self.audioFormatCombo = QtWidgets.QComboBox()
-        self.audioFormatCombo.addItems(
-            [T[self.lang]["audio_ogg"], T[self.lang]["audio_wav"]]
-        )
+        self.audioFormatCombo.addItems([self.tr("audio_ogg"), self.tr("audio_wav")])
         # Set current selection based on self.audio_format
         self.audioFormatCombo.setCurrentIndex(0 if self.audio_format == "ogg" else 1)
         self.audioFormatCombo.currentIndexChanged.connect(self._audio_format_changed)
@@ -1127,6 +2025,21 @@ class SleepTracker(QtWidgets.QWidget):
         audioRow.addStretch(1)
         sc.addLayout(audioRow)
 
+        # Audio block size (callback latency) setting
+        blockRow = QtWidgets.QHBoxLayout()
+        self.lblBlockSize = QtWidgets.QLabel(self.tr("block_size") + ":")
+        self.blockSizeCombo = QtWidgets.QComboBox()
+        self.blockSizeCombo.addItems(
+            [f"{n} ({n / self.RATE * 1000:.1f} ms)" for n in self.BLOCK_SIZES]
+        )
+        self.blockSizeCombo.setCurrentIndex(self.BLOCK_SIZES.index(self.block_size))
+        self.blockSizeCombo.currentIndexChanged.connect(self._block_size_changed)
+        self.blockSizeCombo.setEnabled(not self.monitoring)
+        blockRow.addWidget(self.lblBlockSize)
+        blockRow.addWidget(self.blockSizeCombo)
+        blockRow.addStretch(1)
+        sc.addLayout(blockRow)
+
         # Action buttons row (Delete All, Export ZIP)
         btnRow = QtWidgets.QHBoxLayout()
         btnRow.addStretch(1)
@@ -1144,9 +2057,9 @@ class SleepTracker(QtWidgets.QWidget):
         sc.addStretch(1)
         sv.addWidget(settingsCard)
         sv.addStretch(1)
-        self.tabs.addTab(settings, T[self.lang]["tab_settings"])
+        return settings
 
-        # -- About tab --
+    def _build_about_tab(self) -> QtWidgets.QWidget:
         about = QtWidgets.QWidget()
         av = QtWidgets.QVBoxLayout(about)
         av.setSpacing(10)
@@ -1156,7 +2069,7 @@ class SleepTracker(QtWidgets.QWidget):
         ac = QtWidgets.QVBoxLayout(aboutCard)
         ac.setContentsMargins(16, 16, 16, 16)
         self.aboutLabel = QtWidgets.QLabel(
-            T[self.lang]["about_text"].format(version=VERSION)
+            self.tr("about_text").format(version=VERSION)
         )
         self.aboutLabel.setWordWrap(True)
         self.aboutLabel.setTextFormat(QtCore.Qt.TextFormat.RichText)
@@ -1169,46 +2082,7 @@ class SleepTracker(QtWidgets.QWidget):
         imageLabel = QtWidgets.QLabel()
         image_path = os.path.join(APP_DIR, "image.png")
         if os.path.exists(image_path):
-            # Load original image with transparency
-            pixmap = QtGui.QPixmap(image_path)
-
-            # Scale to larger size (zoom in) - crop 20px from edges
-            # Calculate crop area (20px margin from each side)
-            original_size = pixmap.size()
-            crop_rect = QtCore.QRect(
-                20, 20, original_size.width() - 40, original_size.height() - 40
-            )
-
-            # Crop: image to remove 20px border
-            if crop_rect.isValid() and crop_rect.width() > 0 and crop_rect.height() > 0:
-                cropped_pixmap = pixmap.copy(crop_rect)
-            else:
-                cropped_pixmap = pixmap
-
-            # Scale the cropped image to larger size for zoom effect
-            # Use even larger dimensions for better visibility
-            scaled_pixmap = cropped_pixmap.scaled(
-                450,
-                350,  # Even larger size for better zoom effect
-                QtCore.Qt.AspectRatioMode.KeepAspectRatio,
-                QtCore.Qt.TransformationMode.SmoothTransformation,
-            )
-
-            # Crop the image to remove 20px border
-            if crop_rect.isValid() and crop_rect.width() > 0 and crop_rect.height() > 0:
-                cropped_pixmap = pixmap.copy(crop_rect)
-            else:
-                cropped_pixmap = pixmap
-
-            # Scale the cropped image to larger size for zoom effect
-            # Use larger dimensions for better visibility
-            scaled_pixmap = cropped_pixmap.scaled(
-                400,
-                320,  # Much larger size for zoom effect
-                QtCore.Qt.AspectRatioMode.KeepAspectRatio,
-                QtCore.Qt.TransformationMode.SmoothTransformation,
-            )
-
+            scaled_pixmap = about_pixmap(image_path, os.path.getmtime(image_path))
             imageLabel.setPixmap(scaled_pixmap)
             imageLabel.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
 
@@ -1230,11 +2104,11 @@ class SleepTracker(QtWidgets.QWidget):
         ac.addSpacing(16)
         # Help and License buttons
         aboutBtnRow = QtWidgets.QHBoxLayout()
-        self.btnHelp = QtWidgets.QPushButton(T[self.lang]["help"])
+        self.btnHelp = QtWidgets.QPushButton(self.tr("help"))
         self.btnHelp.setProperty("variant", "ghost")
         self.btnHelp.clicked.connect(self._show_help_dialog)
         aboutBtnRow.addWidget(self.btnHelp)
-        self.btnLicense = QtWidgets.QPushButton(T[self.lang]["license"])
+        self.btnLicense = QtWidgets.QPushButton(self.tr("license"))
         self.btnLicense.setProperty("variant", "ghost")
         self.btnLicense.clicked.connect(self._show_license_dialog)
         aboutBtnRow.addWidget(self.btnLicense)
@@ -1243,36 +2117,59 @@ class SleepTracker(QtWidgets.QWidget):
         ac.addStretch(1)
         av.addWidget(aboutCard)
         av.addStretch(1)
-        self.tabs.addTab(about, T[self.lang]["tab_about"])
-
-        self._apply_header_styles()
-        self._refresh_history()
+        return about
 
     # ---- i18n/theme ----
 
     def _lang_changed(self, idx: int) -> None:
         self.lang = ["en", "hr", "de"][idx]
-        self.setWindowTitle(T[self.lang]["title"])
-        self.tabs.setTabText(0, T[self.lang]["tab_home"])
-        self.tabs.setTabText(1, T[self.lang]["tab_hist"])
-        self.tabs.setTabText(2, T[self.lang]["tab_settings"])
-        self.tabs.setTabText(3, T[self.lang]["tab_about"])
-        self.btnStart.setText(
-            T[self.lang]["stop"] if self.monitoring else T[self.lang]["start"]
-        )
-        self.lblSens.setText(f"{T[self.lang]['sensitivity']} ({self._sens_pct}%)")
-        self.lblMax.setText(
-            f"{T[self.lang]['maxlen']} ({self.max_len_s if self.max_len_s > 0 else '∞'} s)"
+        self.tr = T[self.lang].__getitem__
+        self.setWindowTitle(self.tr("title"))
+        self.tabs.setTabText(0, self.tr("tab_home"))
+        self.tabs.setTabText(1, self.tr("tab_hist"))
+        self.tabs.setTabText(2, self.tr("tab_settings"))
+        self.tabs.setTabText(3, self.tr("tab_about"))
+        self.btnStart.setText(self.tr("stop") if self.monitoring else self.tr("start"))
+        self.lblSens.setText(f"{self.tr('sensitivity')} ({self._sens_pct}%)")
+        self.lblMax.setText(f"{self.tr('maxlen')} ({self.maxlen.value() or '∞'} s)")
+        self.table.setHorizontalHeaderLabels(
+            [
+                self.tr("date"),
+                self.tr("time"),
+                self.tr("length"),
+                self.tr("playstop"),
+                "Waveform",
+                self.tr("delete"),
+            ]
         )
-        self.lblLang.setText(T[self.lang]["language"] + ":")
-        self.lblDateFmt.setText(T[self.lang]["date_format"] + ":")
-        self.lblTimeFmt.setText(T[self.lang]["time_format"] + ":")
+        self._refresh_pending.start()
+        # tabs that were never opened get built in the new language later
+        if self._tab_built[1]:
+            self.sessionTable.setHorizontalHeaderLabels(
+                [
+                    self.tr("day"),
+                    self.tr("date"),
+                    "Start",
+                    "End",
+                    self.tr("sleep_duration"),
+                ]
+            )
+        if self._tab_built[3]:
+            self.aboutLabel.setText(self.tr("about_text").format(version=VERSION))
+        if self._tab_built[2]:
+            self._retext_settings()
+
+    def _retext_settings(self) -> None:
+        self.lblLang.setText(self.tr("language") + ":")
+        self.lblDateFmt.setText(self.tr("date_format") + ":")
+        self.lblTimeFmt.setText(self.tr("time_format") + ":")
+        self.lblBlockSize.setText(self.tr("block_size") + ":")
         # Update date format combo items
         self.dateFormatCombo.blockSignals(True)
         cur_date_idx = self.dateFormatCombo.currentIndex()
         self.dateFormatCombo.clear()
         self.dateFormatCombo.addItems(
-            [T[self.lang]["date_format_eu"], T[self.lang]["date_format_us"]]
+            [self.tr("date_format_eu"), self.tr("date_format_us")]
         )
         self.dateFormatCombo.setCurrentIndex(cur_date_idx)
         self.dateFormatCombo.blockSignals(False)
@@ -1281,7 +2178,7 @@ class SleepTracker(QtWidgets.QWidget):
         cur_time_idx = self.timeFormatCombo.currentIndex()
         self.timeFormatCombo.clear()
         self.timeFormatCombo.addItems(
-            [T[self.lang]["time_format_24"], T[self.lang]["time_format_12"]]
+            [self.tr("time_format_24"), self.tr("time_format_12")]
         )
         self.timeFormatCombo.setCurrentIndex(cur_time_idx)
         self.timeFormatCombo.blockSignals(False)
@@ -1289,48 +2186,25 @@ class SleepTracker(QtWidgets.QWidget):
         self.audioFormatCombo.blockSignals(True)
         cur_audio_idx = self.audioFormatCombo.currentIndex()
         self.audioFormatCombo.clear()
-        self.audioFormatCombo.addItems(
-            [T[self.lang]["audio_ogg"], T[self.lang]["audio_wav"]]
-        )
+        self.audioFormatCombo.addItems([self.tr("audio_ogg"), self.tr("audio_wav")])
         self.audioFormatCombo.setCurrentIndex(cur_audio_idx)
         self.audioFormatCombo.blockSignals(False)
-        # Update about text
-        self.aboutLabel.setText(T[self.lang]["about_text"].format(version=VERSION))
-        # Update table headers
-        self.table.setHorizontalHeaderLabels(
-            [
-                T[self.lang]["date"],
-                T[self.lang]["time"],
-                T[self.lang]["length"],
-                T[self.lang]["playstop"],
-                "Waveform",
-                T[self.lang]["delete"],
-            ]
-        )
-        self.sessionTable.setHorizontalHeaderLabels(
-            [
-                T[self.lang]["day"],
-                T[self.lang]["date"],
-                "Start",
-                "End",
-                T[self.lang]["sleep_duration"],
-            ]
-        )
-        self._apply_header_styles()
-        self._refresh_history()
-        self._refresh_recordings_table()
 
     def apply_theme(self) -> None:
         self.theme_palette = THEME_PALETTE
+        self._fg_color = self.theme_palette["fg"]
         QtWidgets.QApplication.setStyle("Fusion")
         app = QtWidgets.QApplication.instance()
         if app:
-            app.setStyleSheet(qss_for(self.theme_palette))
+            qss = qss_for(self.theme_palette)
+            # re-setting an identical sheet still re-polishes every widget
+            if app.styleSheet() != qss:
+                app.setStyleSheet(qss)
         self._refresh_icons()
         self._apply_header_styles()
 
     def _refresh_icons(self) -> None:
-        col = self.theme_palette["fg"] if self.theme_palette else "#fff"
+        col = self._fg_color
         self.btnStart.setIcon(
             icon_stop(22, col) if self.monitoring else icon_play(22, col)
         )
@@ -1339,86 +2213,92 @@ class SleepTracker(QtWidgets.QWidget):
         if not self.theme_palette:
             return
         pal = self.theme_palette
-        header_style = (
-            f"QHeaderView::section {{"
-            f"background: rgba(255,255,255,0.08);"
-            f"color: {pal['fg']};"
-            f"border: 0;"
-            f"border-bottom: 1px solid {pal['border']};"
-            f"padding: 8px 10px; }}"
-        )
-        for t in (self.table, self.sessionTable):
-            try:
-                t.horizontalHeader().setStyleSheet(header_style)
-            except Exception:
-                pass
+        header_style = header_qss(pal["fg"], pal["border"])
+        for t in (self.table, getattr(self, "sessionTable", None)):
+            if t is None:
+                continue  # History tab not built yet; it styles itself when it is
+            header = t.horizontalHeader()
+            # re-setting an identical sheet still re-polishes the header
+            if header.styleSheet() != header_style:
+                header.setStyleSheet(header_style)
 
     def _on_player_state(self, state) -> None:
-        try:
-            if state == QMediaPlayer.PlaybackState.StoppedState and self.current_play:
-                btn_ref, _path = self.current_play
-                btn = btn_ref() if callable(btn_ref) else None
-                if btn:
-                    btn.setIcon(
-                        icon_play(
-                            18,
-                            self.theme_palette["fg"] if self.theme_palette else "#fff",
-                        )
-                    )
-                    setattr(btn, "_is_playing", False)
-                self.current_play = None
-        except Exception:
-            pass
+        if state != QMediaPlayer.PlaybackState.StoppedState or not self.current_play:
+            return
+        btn_ref, _path = self.current_play  # always (weakref(btn), path)
+        self.current_play = None
+        btn = btn_ref()
+        if btn:
+            try:
+                btn.setIcon(icon_play(18, self._fg_color))
+                btn._is_playing = False
+            except RuntimeError:
+                pass  # row widget already deleted on the C++ side
 
     # ---- settings ----
+    # 0% -> -20dB (least sensitive), 100% -> -60dB (most sensitive)
+    _PCT_TO_DB = tuple(-20 - int(p * 0.4) for p in range(101))
+    # -20dB -> 0%, -60dB -> 100%
+    _DB_TO_PCT = {db: int((-20 - db) / 0.4) for db in range(-60, -19)}
+
     def _pct_to_threshold(self, pct: int) -> int:
         """Convert sensitivity percentage (0-100) to dB threshold (-20 to -60)."""
-        # 0% -> -20dB (least sensitive), 100% -> -60dB (most sensitive)
-        return -20 - int(pct * 0.4)
+        return self._PCT_TO_DB[pct]
 
     def _threshold_to_pct(self, db: int) -> int:
         """Convert dB threshold (-20 to -60) to sensitivity percentage (0-100)."""
-        # -20dB -> 0%, -60dB -> 100%
-        return int((-20 - db) / 0.4)
+        return self._DB_TO_PCT[max(-60, min(-20, db))]
 
     def _sens_changed(self, v: int) -> None:
         self._sens_pct = v
-        self.threshold_db = self._pct_to_threshold(v)
-        self.lblSens.setText(f"{T[self.lang]['sensitivity']} ({v}%)")
+        self.lblSens.setText(f"{self.tr('sensitivity')} ({v}%)")
+        self._sens_commit_timer.start()
+
+    def _commit_sens(self) -> None:
+        self.threshold_db = self._pct_to_threshold(self._sens_pct)
 
     def _maxlen_changed(self, v: int) -> None:
-        self.max_len_s = v
         if v <= 0:
-            self.lblMax.setText(f"{T[self.lang]['maxlen']} (∞)")
+            self.lblMax.setText(f"{self.tr('maxlen')} (∞)")
         else:
-            self.lblMax.setText(f"{T[self.lang]['maxlen']} ({v} s)")
+            self.lblMax.setText(f"{self.tr('maxlen')} ({v} s)")
+        self._maxlen_commit_timer.start()
+
+    def _commit_maxlen(self) -> None:
+        self.max_len_s = self.maxlen.value()
 
     def _date_format_changed(self, idx: int) -> None:
         self.date_format = ["eu", "us"][idx]
-        self._refresh_history()
-        self._refresh_recordings_table()
+        self._refresh_pending.start()
 
     def _time_format_changed(self, idx: int) -> None:
         self.time_format = ["24", "12"][idx]
+        self._refresh_pending.start()
+
+    def _do_refresh_all(self) -> None:
         self._refresh_history()
-        self._refresh_recordings_table()
+        self._retext_dates()
 
     def _audio_format_changed(self, idx: int) -> None:
         self.audio_format = ["ogg", "wav"][idx]
 
+    def _block_size_changed(self, idx: int) -> None:
+        # applied on the next Start; the combo is disabled while monitoring
+        self.block_size = self.BLOCK_SIZES[idx]
+
     def _format_date(self, dt: datetime.datetime) -> str:
         """Format date according to user preference."""
         if self.date_format == "us":
-            return dt.strftime("%m/%d/%Y")
+            return _strftime(dt, "%m/%d/%Y")
         else:
-            return dt.strftime("%d.%m.%Y")
+            return _strftime(dt, "%d.%m.%Y")
 
     def _format_time(self, dt: datetime.datetime) -> str:
         """Format time according to user preference."""
         if self.time_format == "12":
-            return dt.strftime("%I:%M %p")
+            return _strftime(dt, "%I:%M %p")
         else:
-            return dt.strftime("%H:%M")
+            return _strftime(dt, "%H:%M")
 
     def _format_datetime(self, dt: datetime.datetime) -> tuple:
         """Format datetime into (date_str, time_str) according to user preferences."""
@@ -1451,12 +2331,12 @@ SOFTWARE."""
     def _show_help_dialog(self) -> None:
         """Show help dialog with usage instructions."""
         dialog = QtWidgets.QDialog(self)
-        dialog.setWindowTitle(T[self.lang]["help"])
+        dialog.setWindowTitle(self.tr("help"))
         dialog.setMinimumSize(500, 400)
         layout = QtWidgets.QVBoxLayout(dialog)
 
         text = QtWidgets.QTextEdit()
-        text.setPlainText(T[self.lang]["help_text"])
+        text.setPlainText(self.tr("help_text"))
         text.setReadOnly(True)
         layout.addWidget(text)
 
@@ -1471,7 +2351,7 @@ SOFTWARE."""
     def _show_license_dialog(self) -> None:
         """Show license dialog."""
         dialog = QtWidgets.QDialog(self)
-        dialog.setWindowTitle(T[self.lang]["license"])
+        dialog.setWindowTitle(self.tr("license"))
         dialog.setMinimumSize(500, 400)
         layout = QtWidgets.QVBoxLayout(dialog)
 
@@ -1488,143 +2368,134 @@ SOFTWARE."""
 
         dialog.exec()
 
-    # ---- timers & audio ----
-    def _wire_timers(self) -> None:
-        self.timer = QtCore.QTimer(self)
-        self.timer.setInterval(50)
-        self.timer.timeout.connect(self._drain_audio)
-        self.timer.start()
-
+    # ---- audio ----
     def _toggle_monitor(self) -> None:
         if not self.monitoring:
             try:
-                self.stream = sd.InputStream(
+                import sounddevice as sd
+
+                if self._ring.buf.shape[1] != self.block_size:
+                    self._alloc_audio_buffers()
+                self._ring.reset()
+                self.processor = AudioProcessor(self)
+                self.processor.levels.connect(
+                    self._update_meter, QtCore.Qt.ConnectionType.QueuedConnection
+                )
+                self.processor.start(QtCore.QThread.Priority.TimeCriticalPriority)
+                # raw stream: the callback gets the driver buffer, no ndarray per block
+                self.stream = sd.RawInputStream(
                     samplerate=self.RATE,
                     channels=self.CH,
+                    dtype="float32",
+                    latency="low",
                     callback=self._cb,
-                    blocksize=self.BLOCK,
+                    blocksize=self.block_size,
                 )
-                self.stream.start()
                 self.monitoring = True
-                self.session_start = QtCore.QDateTime.currentDateTime()
-                self.btnStart.setText(T[self.lang]["stop"])
+                self.stream.start()
+                if self._tab_built[2]:
+                    self.blockSizeCombo.setEnabled(False)
+                self.session_start = datetime.datetime.now()
+                self._session_start_mono = time.monotonic()
+                self.btnStart.setText(self.tr("stop"))
                 self._refresh_icons()
-                self.above_ms = self.below_ms = 0.0
-                self.capturing = False
-                self.capture_frames.clear()
             except Exception as e:
+                self.monitoring = False
+                self.stream = None
+                self._stop_processor()
                 QtWidgets.QMessageBox.critical(self, "Audio error", str(e))
         else:
             if self.stream:
                 self.stream.stop()
                 self.stream.close()
                 self.stream = None
+            self._stop_processor()
             self.monitoring = False
-            self._finalize_clip(force=True)
-            self.btnStart.setText(T[self.lang]["start"])
+            if self._tab_built[2]:
+                self.blockSizeCombo.setEnabled(True)
+            self.btnStart.setText(self.tr("start"))
             self._refresh_icons()
             if self.session_start:
-                end = QtCore.QDateTime.currentDateTime()
-                dur = int(self.session_start.msecsTo(end) / 1000)
+                dur = int(time.monotonic() - self._session_start_mono)
+                end = datetime.datetime.now()
                 self._save_session(self.session_start, end, dur)
                 self.session_start = None
                 self._refresh_history()
 
+    def _alloc_audio_buffers(self) -> None:
+        """(Re)size the callback ring for ``self.block_size``."""
+        bs = self.block_size
+        # preallocated ring the audio callback copies into: no per-block allocations
+        # or locks on the PortAudio thread, bounded memory if the consumer stalls
+        self._ring = BlockRing(int(self.RING_MS / 1000 * self.RATE / bs) + 1, bs)
+
+    def _stop_processor(self) -> None:
+        """Stop the processing thread; it drains the ring and saves any open clip."""
+        if self.processor is not None:
+            self.processor.stop()
+            self.processor = None
+
     def _cb(self, indata, frames, time, status) -> None:
         if status:
             pass
-        self.q.put(indata.copy())
-
-    def _drain_audio(self) -> None:
-        while not self.q.empty():
-            block = self.q.get()
-            block_ms = len(block) / self.RATE * 1000.0
-            rms = float(np.sqrt(np.mean(np.square(block)) + self.EPS))
-            inst_db = 20.0 * np.log10(rms + self.EPS)
-            self.smooth_db = (
-                self.EMA_ALPHA * inst_db + (1.0 - self.EMA_ALPHA) * self.smooth_db
-            )
-            self.lblDb.setText(f"{inst_db:0.1f} dB")
-            self.levelBar.setValue(
-                max(0, min(100, int((inst_db + 60) * (100.0 / 60.0))))
-            )
-
-            if not self.monitoring:
-                continue
-
-            start_th = self.threshold_db
-            stop_th = self.threshold_db - 6.0  # hystereza
-            above = self.smooth_db >= start_th
-            self.preroll.append(block)
-
-            if above:
-                self.above_ms += block_ms
-                self.below_ms = 0.0
-            else:
-                self.below_ms += block_ms
-                self.above_ms = 0.0
-
-            if not self.capturing and self.above_ms >= self.ARM_MS:
-                self._start_capture()
-
-            if self.capturing:
-                self.capture_frames.append(block)
-                try:
-                    self.capture_samples += block.shape[0]
-                except Exception:
-                    pass
-                hit_hysteresis = (
-                    self.smooth_db < stop_th and self.below_ms >= self.HANG_MS
-                )
-                hit_max = (
-                    self.max_len_s > 0
-                    and (self.capture_samples / self.RATE) >= self.max_len_s
-                )
-                if hit_hysteresis or hit_max:
-                    self._finalize_clip()
-
-    def _start_capture(self) -> None:
-        self.capturing = True
-        self.capture_frames = list(self.preroll)
-        try:
-            self.capture_samples = sum(b.shape[0] for b in self.capture_frames)
-        except Exception:
-            self.capture_samples = 0
-        self.preroll.clear()
-
-    def _finalize_clip(self, force: bool = False) -> None:
-        if not self.capturing and not force:
-            return
-        frames = self.capture_frames if self.capturing else []
-        self.capturing = False
-        self.capture_frames = []
-        self.above_ms = self.below_ms = 0.0
-        if not frames:
-            return
-        data = np.concatenate(frames, axis=0)
+        # zero-copy view of the cffi buffer; first channel only
+        samples = np.frombuffer(indata, dtype=np.float32, count=frames * self.CH)
+        self._ring.write(samples[:: self.CH])
+
+    @QtCore.Slot(float, float, int)
+    def _update_meter(self, db: float, smooth_db: float, pct: int) -> None:
+        self.lblDb.setText(f"{db:0.1f} dB")
+        self.levelBar.setValue(pct)
+
+    def _to_int16(self, data: np.ndarray) -> np.ndarray:
+        """Scale float32 samples to int16 PCM in reused scratch buffers.
+
+        Same result as ``(np.clip(data, -1, 1) * 32767).astype(np.int16)``, but
+        scale and clip run in place and the cast writes straight into the
+        output, so no clip-sized temporaries are allocated per clip.
+        """
+        n = data.shape[0]
+        if self._f32_scratch.shape[0] < n:
+            self._f32_scratch = np.empty(n, dtype=np.float32)
+            self._i16_scratch = np.empty(n, dtype=np.int16)
+        tmp = self._f32_scratch[:n]
+        out = self._i16_scratch[:n]
+        np.multiply(data, _I16_SCALE, out=tmp)
+        np.clip(tmp, _I16_MIN, _I16_MAX, out=tmp)
+        np.copyto(out, tmp, casting="unsafe")  # truncates, like astype
+        return out
+
+    def _clip_path(self, stamp: datetime.datetime, ext: str) -> str:
+        """Free recording path for ``stamp``: same-second clips get ``_1``, ``_2``..."""
+        base = os.path.join(self.out_dir, stamp.strftime("%Y%m%d_%H%M%S"))
+        path = base + ext
+        n = 1
+        while os.path.exists(path):
+            path = f"{base}_{n}{ext}"
+            n += 1
+        return path
+
+    def _write_clip(
+        self, data: np.ndarray, stamp: datetime.datetime, audio_format: str
+    ) -> None:
+        """Encode one finished clip to disk (runs on the writer thread)."""
         dur = data.shape[0] / self.RATE
+        # not the _ensure_dir memo: recordings/ may have been removed since startup
+        os.makedirs(self.out_dir, exist_ok=True)
         # Use user-selected audio format
-        if self.audio_format == "ogg":
+        if audio_format == "ogg":
             try:
-                import soundfile as sf
-
-                fname = datetime.datetime.now().strftime("%Y%m%d_%H%M%S") + ".ogg"
-                path = os.path.join(self.out_dir, fname)
-                sf.write(
-                    path,
-                    data.astype("float32"),
-                    self.RATE,
-                    format="OGG",
-                    subtype="VORBIS",
-                )
+                path = self._clip_path(stamp, ".ogg")
+                with sf.SoundFile(
+                    path, "w", self.RATE, self.CH, format="OGG", subtype="VORBIS"
+                ) as f:
+                    _sf_write(f, data)  # already float32, no conversion copy
             except Exception:
                 # Fallback to WAV if soundfile fails
                 import wave as _w
 
-                data16 = np.clip(data, -1.0, 1.0)
-                data16 = (data16 * 32767.0).astype(np.int16)
-                fname = datetime.datetime.now().strftime("%Y%m%d_%H%M%S") + ".wav"
-                path = os.path.join(self.out_dir, fname)
+                data16 = self._to_int16(data)
+                path = self._clip_path(stamp, ".wav")
                 with _w.open(path, "wb") as wf:
                     wf.setnchannels(self.CH)
                     wf.setsampwidth(2)
@@ -1633,17 +2504,34 @@ SOFTWARE."""
         else:  # wav format
             import wave as _w
 
-            data16 = np.clip(data, -1.0, 1.0)
-            data16 = (data16 * 32767.0).astype(np.int16)
-            fname = datetime.datetime.now().strftime("%Y%m%d_%H%M%S") + ".wav"
-            path = os.path.join(self.out_dir, fname)
+            data16 = self._to_int16(data)
+            path = self._clip_path(stamp, ".wav")
             with _w.open(path, "wb") as wf:
                 wf.setnchannels(self.CH)
                 wf.setsampwidth(2)
                 wf.setframerate(self.RATE)
                 wf.writeframes(data16.tobytes())
-        self._add_row(path, dur)
-        self.capture_samples = 0
+        # the samples are at hand: write the waveform sidecar now, so the new
+        # row's widget loads it instead of decoding the file it just wrote
+        WaveformDelegate.save_cache(path, WaveformDelegate.bars_from_samples(data))
+        self.clipSaved.emit(path, dur)
+
+    def _clip_written(self, fut: concurrent.futures.Future) -> None:
+        exc = fut.exception()
+        if exc is not None:
+            self.clipFailed.emit(str(exc))  # queued to the GUI thread
+
+    def _on_clip_failed(self, msg: str) -> None:
+        # a failing disk fails every chunk of a streamed clip: one box at a time
+        if self._clip_error_open:
+            return
+        self._clip_error_open = True
+        try:
+            QtWidgets.QMessageBox.warning(
+                self, "Save recording", f"Cannot save recording:\n{msg}"
+            )
+        finally:
+            self._clip_error_open = False
 
     # ---- playback helpers ----
     def _stop_current(self) -> None:
@@ -1669,17 +2557,26 @@ SOFTWARE."""
         btn = btn_ref() if callable(btn_ref) else None
         if btn:
             try:
-                btn.setIcon(
-                    icon_play(
-                        18, self.theme_palette["fg"] if self.theme_palette else "#fff"
-                    )
-                )
+                btn.setIcon(icon_play(18, self._fg_color))
                 setattr(btn, "_is_playing", False)
             except Exception:
                 pass
         self.current_play = None
 
     # ---- recordings table ops ----
+    @staticmethod
+    @contextlib.contextmanager
+    def _frozen(table: QtWidgets.QTableWidget):
+        """Batch row rebuilds: one repaint at the end instead of one per cell."""
+        table.setUpdatesEnabled(False)
+        table.blockSignals(True)
+        try:
+            yield table
+        finally:
+            table.blockSignals(False)
+            table.setUpdatesEnabled(True)
+            table.viewport().update()
+
     def _load_existing_recordings(self) -> None:
         """Load existing recordings from the recordings directory on startup."""
         if not os.path.isdir(self.out_dir):
@@ -1688,43 +2585,105 @@ SOFTWARE."""
         if not hasattr(self, "_recordings_data"):
             self._recordings_data = []
         files = []
-        for fname in os.listdir(self.out_dir):
-            if fname.lower().endswith((".wav", ".ogg", ".mp3", ".flac")):
-                fpath = os.path.join(self.out_dir, fname)
-                files.append((fname, fpath))
+        stats = {}
+        # scandir: type from the directory listing, one stat per recording
+        with os.scandir(self.out_dir) as it:
+            for entry in it:
+                fname = entry.name
+                if not fname.lower().endswith((".wav", ".ogg", ".mp3", ".flac")):
+                    continue
+                try:
+                    if not entry.is_file():
+                        continue
+                    stats[fname] = entry.stat()
+                except OSError:
+                    continue
+                files.append((fname, entry.path))
         # Sort by filename (which contains timestamp)
         files.sort(key=lambda x: x[0])
+        # durations probed on earlier launches: fname -> [mtime_ns, size, seconds]
+        cache_file = os.path.join(self.out_dir, self.DURATIONS_FILE)
+        try:
+            with open(cache_file, "rb") as f:
+                cached = _loads(f.read())
+        except Exception:
+            cached = {}
+        if not isinstance(cached, dict):
+            cached = {}  # valid JSON, but not a cache this app wrote
+        durations = {}
+        misses = []
         for fname, fpath in files:
-            # Get file duration
-            dur = self._get_audio_duration(fpath)
+            st = stats[fname]
+            key = [st.st_mtime_ns, st.st_size]
+            hit = cached.get(fname)
+            if isinstance(hit, list) and len(hit) == 3 and hit[:2] == key:
+                durations[fname] = hit  # unchanged since it was last probed
+            else:
+                durations[fname] = key
+                misses.append((fname, fpath))
+        if misses:
+            # header reads are I/O bound: keep several in flight at once
+            with concurrent.futures.ThreadPoolExecutor(
+                max_workers=min(8, len(misses))
+            ) as ex:
+                probed = ex.map(self._get_audio_duration, [p for _, p in misses])
+                for (fname, _), dur in zip(misses, probed):
+                    durations[fname] = durations[fname] + [dur]
+        entries = []
+        for fname, fpath in files:
+            dur = durations[fname][2]
             # Parse timestamp from filename (format: YYYYMMDD_HHMMSS)
             try:
                 base = os.path.splitext(fname)[0]
-                dt = datetime.datetime.strptime(base, "%Y%m%d_%H%M%S")
+                # YYYYMMDD_HHMMSS is 15 characters; _clip_path may add _<n>
+                dt = datetime.datetime.strptime(base[:15], "%Y%m%d_%H%M%S")
             except ValueError:
                 # Fallback to file modification time
-                mtime = os.path.getmtime(fpath)
-                dt = datetime.datetime.fromtimestamp(mtime)
-            self._recordings_data.append((fpath, dur, dt))
-            self._add_row_with_datetime(fpath, dur, dt)
+                dt = datetime.datetime.fromtimestamp(stats[fname].st_mtime)
+            entries.append((fpath, dur, dt))
+        self._recordings_data.extend(entries)
+        self._add_rows_bulk(entries)
+        if durations != cached:
+            # rewritten only when files were added, changed or removed
+            try:
+                with open(cache_file, "wb") as f:
+                    f.write(_dumps(durations))
+            except OSError:
+                pass
 
     def _get_audio_duration(self, path: str) -> float:
-        """Get duration of audio file in seconds."""
+        """Get duration of audio file in seconds (header reads only)."""
         try:
-            import soundfile as sf
-
             info = sf.info(path)
             return info.duration
         except Exception:
             pass
-        try:
-            import wave
+        if path.lower().endswith(".wav"):
+            return self._wav_header_duration(path)
+        return 0.0
 
-            with wave.open(path, "rb") as wf:
-                frames = wf.getnframes()
-                rate = wf.getframerate()
-                return frames / rate if rate > 0 else 0.0
-        except Exception:
+    @staticmethod
+    def _wav_header_duration(path: str) -> float:
+        """Duration from a RIFF/WAVE header: walks the chunk list to fmt and data."""
+        try:
+            with open(path, "rb") as f:
+                riff, _size, wave = struct.unpack("<4sI4s", f.read(12))
+                if riff != b"RIFF" or wave != b"WAVE":
+                    return 0.0
+                byte_rate = 0
+                while True:
+                    head = f.read(8)
+                    if len(head) < 8:
+                        return 0.0
+                    cid, clen = struct.unpack("<4sI", head)
+                    if cid == b"fmt ":
+                        fmt = f.read(clen + (clen & 1))
+                        byte_rate = struct.unpack_from("<I", fmt, 8)[0]
+                    elif cid == b"data":
+                        return clen / byte_rate if byte_rate > 0 else 0.0
+                    else:
+                        f.seek(clen + (clen & 1), os.SEEK_CUR)
+        except (OSError, struct.error):
             return 0.0
 
     def _add_row_with_datetime(
@@ -1733,6 +2692,18 @@ SOFTWARE."""
         """Add a row to the recordings table with a datetime object."""
         row = self.table.rowCount()
         self.table.insertRow(row)
+        self._fill_row(row, path, dur, dt)
+
+    def _add_rows_bulk(self, entries: list) -> None:
+        """Append (path, dur, dt) rows: one setRowCount and one repaint for all."""
+        base = self.table.rowCount()
+        with self._frozen(self.table):
+            self.table.setRowCount(base + len(entries))
+            for i, (path, dur, dt) in enumerate(entries):
+                self._fill_row(base + i, path, dur, dt)
+
+    def _fill_row(self, row: int, path: str, dur: float, dt: datetime.datetime) -> None:
+        """Populate the cells of an existing recordings table row."""
         date_str, time_str = self._format_datetime(dt)
         date_item = QtWidgets.QTableWidgetItem(date_str)
         date_item.setTextAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
@@ -1745,26 +2716,44 @@ SOFTWARE."""
         length_item = QtWidgets.QTableWidgetItem(f"{dur:.1f}s")
         length_item.setTextAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
         self.table.setItem(row, 2, length_item)
-        fg = self.theme_palette["fg"] if self.theme_palette else "#fff"
+        fg = self._fg_color
 
         # Play button (column 3)
         btnPlay = QtWidgets.QPushButton()
         btnPlay.setIcon(icon_play(18, fg))
         btnPlay.setProperty("variant", "ghost")
-        btnPlay.clicked.connect(lambda _, p=path, b=btnPlay: self._playstop(p, b))
+        btnPlay.setProperty("path", path)
+        btnPlay.clicked.connect(self._on_play_clicked)
         self.table.setCellWidget(row, 3, btnPlay)
 
         # Waveform widget (column 4)
-        waveform = WaveformWidget(path)
-        self.table.setCellWidget(row, 4, waveform)
+        # painted by WaveformDelegate, which only needs the path
+        waveform = QtWidgets.QTableWidgetItem()
+        waveform.setData(QtCore.Qt.ItemDataRole.UserRole, path)
+        self.table.setItem(row, 4, waveform)
 
         # Delete button (column 5)
         btnDel = QtWidgets.QPushButton()
         btnDel.setIcon(icon_trash(16, fg))
         btnDel.setProperty("variant", "ghost")
-        btnDel.clicked.connect(lambda _, b=btnDel, p=path: self._delete_btn(b, p))
+        btnDel.setProperty("path", path)
+        # follows the row as rows above it are removed
+        btnDel._row_index = QtCore.QPersistentModelIndex(
+            self.table.model().index(row, 5)
+        )
+        btnDel.clicked.connect(self._on_delete_clicked)
         self.table.setCellWidget(row, 5, btnDel)
 
+    @QtCore.Slot()
+    def _on_play_clicked(self) -> None:
+        btn = self.sender()
+        self._playstop(btn.property("path"), btn)
+
+    @QtCore.Slot()
+    def _on_delete_clicked(self) -> None:
+        btn = self.sender()
+        self._delete_btn(btn, btn.property("path"))
+
     def _add_row(self, path: str, dur: float) -> None:
         """Add a new recording row (for live recordings)."""
         dt = datetime.datetime.now()
@@ -1774,20 +2763,27 @@ SOFTWARE."""
         self._recordings_data.append((path, dur, dt))
         self._add_row_with_datetime(path, dur, dt)
 
-    def _refresh_recordings_table(self) -> None:
-        """Refresh the recordings table with current date/time format."""
+    def _retext_dates(self) -> None:
+        """Re-render the date/time cells in the current format; no widget is touched."""
         if not hasattr(self, "_recordings_data"):
             return
-        # Save current data
-        data = self._recordings_data[:]
-        # Clear table
-        self.table.setRowCount(0)
-        self._recordings_data = []
-        # Re-add all rows
-        for path, dur, dt in data:
-            if os.path.exists(path):
-                self._recordings_data.append((path, dur, dt))
-                self._add_row_with_datetime(path, dur, dt)
+        # rows mirror _recordings_data one to one
+        with self._frozen(self.table):
+            for r, (_path, _dur, dt) in enumerate(self._recordings_data):
+                date_str, time_str = self._format_datetime(dt)
+                self.table.item(r, 0).setText(date_str)
+                self.table.item(r, 1).setText(time_str)
+
+    def _prune_missing_files(self) -> None:
+        """Drop the rows of recordings deleted behind the app's back."""
+        if not hasattr(self, "_recordings_data"):
+            return
+        data = self._recordings_data
+        with self._frozen(self.table):
+            for r in range(len(data) - 1, -1, -1):
+                if not os.path.exists(data[r][0]):
+                    self.table.removeRow(r)
+                    del data[r]
 
     def _playstop(self, path: str, btn: QtWidgets.QPushButton) -> None:
         # toggle ako je isti fajl i već svira
@@ -1803,30 +2799,24 @@ SOFTWARE."""
         # stop bilo što što već svira
         self._stop_current()
         try:
-            url = QtCore.QUrl.fromLocalFile(path)
-            self.player.setSource(url)
-            self.player.play()
-            btn.setIcon(
-                icon_stop(
-                    18, self.theme_palette["fg"] if self.theme_palette else "#fff"
-                )
-            )
-            btn._is_playing = True
-            self.current_play = (weakref.ref(btn), path)
+            self._play_path(path, btn)
         except Exception as e:
             QtWidgets.QMessageBox.critical(self, "Play error", str(e))
             self._stop_current()
 
+    def _play_path(self, path: str, btn: QtWidgets.QPushButton) -> None:
+        """Play ``path`` on the shared player; every row reuses the same output."""
+        self.player.stop()
+        self.player.setSource(QtCore.QUrl.fromLocalFile(path))
+        self.player.play()
+        btn.setIcon(icon_stop(18, self._fg_color))
+        btn._is_playing = True
+        self.current_play = (weakref.ref(btn), path)
+
     def _delete_btn(self, btn: QtWidgets.QPushButton, path: str) -> None:
-        # pronađi red gdje je ovaj gumb (red se može pomaknuti nakon brisanja)
-        row = -1
-        try:
-            for r in range(self.table.rowCount()):
-                if self.table.cellWidget(r, 5) is btn:  # Delete is column 5
-                    row = r
-                    break
-        except Exception:
-            row = -1
+        # red se može pomaknuti nakon brisanja; persistent index ga prati
+        index = getattr(btn, "_row_index", None)
+        row = index.row() if index is not None and index.isValid() else -1
         if row == -1:
             # fallback – bar obriši datoteku
             try:
@@ -1836,9 +2826,20 @@ SOFTWARE."""
                 QtWidgets.QMessageBox.warning(
                     self, "Delete", f"Cannot delete file:\n{e}"
                 )
+            self._remove_sidecars(path)
             return
         self._delete(path, row)
 
+    def _remove_sidecars(self, path: str) -> None:
+        """Remove cache files stored next to a recording (best effort)."""
+        self._wave_delegate.forget(path)
+        try:
+            cache = WaveformDelegate.cache_path(path)
+            if os.path.exists(cache):
+                os.remove(cache)
+        except Exception:
+            pass
+
     def _delete(self, path: str, row: int) -> None:
         self._stop_current()
         try:
@@ -1846,12 +2847,11 @@ SOFTWARE."""
                 os.remove(path)
         except Exception as e:
             QtWidgets.QMessageBox.warning(self, "Delete", f"Cannot delete file:\n{e}")
+        self._remove_sidecars(path)
         self.table.removeRow(row)
-        # Remove from recordings data
+        # Remove from recordings data, by position: rows mirror it one to one
         if hasattr(self, "_recordings_data"):
-            self._recordings_data = [
-                (p, d, t) for p, d, t in self._recordings_data if p != path
-            ]
+            del self._recordings_data[row]
 
     def _delete_all_recordings(self) -> None:
         """Delete all recordings after confirmation."""
@@ -1879,6 +2879,7 @@ SOFTWARE."""
                     os.remove(path)
             except Exception as e:
                 errors.append(f"{os.path.basename(path)}: {e}")
+            self._remove_sidecars(path)
         self.table.setRowCount(0)
         self._recordings_data = []
         if errors:
@@ -1889,9 +2890,9 @@ SOFTWARE."""
             )
 
     def _export_recordings_zip(self) -> None:
-        """Export all recordings to a ZIP file."""
-        import zipfile
-
+        """Export all recordings to a ZIP file (written on a worker thread)."""
+        if self._zip_export is not None:
+            return  # an export is already running
         if not hasattr(self, "_recordings_data") or not self._recordings_data:
             QtWidgets.QMessageBox.information(
                 self, "Export", "No recordings to export."
@@ -1904,41 +2905,81 @@ SOFTWARE."""
         )
         if not path:
             return
-        try:
-            with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as zf:
-                for fpath, _, _ in self._recordings_data:
-                    if os.path.exists(fpath):
-                        zf.write(fpath, os.path.basename(fpath))
+        files = [p for p, _, _ in self._recordings_data]
+        dlg = QtWidgets.QProgressDialog(
+            "Exporting recordings…", "Cancel", 0, len(files), self
+        )
+        dlg.setWindowTitle("Export")
+        dlg.setWindowModality(QtCore.Qt.WindowModality.WindowModal)
+        dlg.setMinimumDuration(300)
+        worker = _ZipWorker(path, files, self)
+        worker.progress.connect(dlg.setValue)
+        dlg.canceled.connect(worker.requestInterruption)
+        worker.finished.connect(self._export_finished)
+        self._zip_export = (worker, dlg)
+        worker.start()
+
+    def _export_finished(self) -> None:
+        worker, dlg = self._zip_export
+        self._zip_export = None
+        dlg.reset()
+        dlg.deleteLater()  # parented to the window: would otherwise pile up
+        worker.deleteLater()
+        if worker.error is not None:
+            QtWidgets.QMessageBox.warning(
+                self, "Export", f"Export failed:\n{worker.error}"
+            )
+        elif not worker.canceled:
             QtWidgets.QMessageBox.information(
                 self,
                 "Export",
-                f"Exported {len(self._recordings_data)} recording(s) to:\n{path}",
+                f"Exported {worker.written} recording(s) to:\n{worker.path}",
             )
-        except Exception as e:
-            QtWidgets.QMessageBox.warning(self, "Export", f"Export failed:\n{e}")
 
     # ---- sessions/history ----
     def _load_sessions(self) -> list:
-        if not os.path.exists(self.sessions_file):
-            return []
+        """Parse the session log (read once at startup; saves keep it in memory)."""
+        sessions = []
         try:
-            with open(self.sessions_file, "r", encoding="utf-8") as f:
-                return json.load(f)
-        except Exception:
+            with open(self.sessions_file, "rb") as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    try:
+                        sessions.append(_loads(line))
+                    except ValueError:
+                        pass  # e.g. a line cut short by a crash mid-append
+        except OSError:
             return []
+        return sessions
+
+    def _migrate_sessions(self, *candidates: str) -> None:
+        """Convert the first existing pre-JSONL session list (a JSON array)."""
+        for old in candidates:
+            try:
+                with open(old, "rb") as f:
+                    sessions = _loads(f.read())
+            except (OSError, ValueError):
+                continue
+            try:
+                with open(self.sessions_file, "wb") as f:
+                    f.write(b"".join(_dumps_line(rec) for rec in sessions))
+            except OSError:
+                pass
+            return
 
     def _save_session(
-        self, start_dt: QtCore.QDateTime, end_dt: QtCore.QDateTime, dur_s: int
+        self, start_dt: datetime.datetime, end_dt: datetime.datetime, dur_s: int
     ) -> None:
         rec = {
-            "start": start_dt.toString(QtCore.Qt.DateFormat.ISODate),
-            "end": end_dt.toString(QtCore.Qt.DateFormat.ISODate),
+            "start": start_dt.isoformat(timespec="seconds"),
+            "end": end_dt.isoformat(timespec="seconds"),
             "duration_s": dur_s,
         }
         self.sessions.append(rec)
         try:
-            with open(self.sessions_file, "w", encoding="utf-8") as f:
-                json.dump(self.sessions, f, ensure_ascii=False, indent=2)
+            with open(self.sessions_file, "ab") as f:
+                f.write(_dumps_line(rec))
         except Exception as e:
             QtWidgets.QMessageBox.warning(
                 self, "Save session", f"Cannot save session log:\n{e}"
@@ -1947,60 +2988,74 @@ SOFTWARE."""
     def _refresh_history(self) -> None:
         if not hasattr(self, "sessionTable"):
             return
-        self.sessionTable.setRowCount(0)
-        days = T[self.lang].get(
-            "days", ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
-        )
-        for rec in self.sessions:
-            try:
-                s = datetime.datetime.fromisoformat(rec["start"])
-                e = datetime.datetime.fromisoformat(rec["end"])
-            except Exception:
-                continue
-            dur = int(rec.get("duration_s", int((e - s).total_seconds())))
-            r = self.sessionTable.rowCount()
-            self.sessionTable.insertRow(r)
-            day_name = days[s.weekday()] if 0 <= s.weekday() < 7 else ""
-            day_item = QtWidgets.QTableWidgetItem(day_name)
-            day_item.setTextAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
-            self.sessionTable.setItem(r, 0, day_item)
-
-            date_item = QtWidgets.QTableWidgetItem(self._format_date(s))
-            date_item.setTextAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
-            self.sessionTable.setItem(r, 1, date_item)
-
-            start_item = QtWidgets.QTableWidgetItem(self._format_time(s))
-            start_item.setTextAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
-            self.sessionTable.setItem(r, 2, start_item)
-
-            end_item = QtWidgets.QTableWidgetItem(self._format_time(e))
-            end_item.setTextAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
-            self.sessionTable.setItem(r, 3, end_item)
-
-            duration_item = QtWidgets.QTableWidgetItem(
-                f"{dur // 3600:02d}:{(dur % 3600) // 60:02d}"
-            )
-            duration_item.setTextAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
-            self.sessionTable.setItem(r, 4, duration_item)
+        with self._frozen(self.sessionTable):
+            self.sessionTable.setRowCount(0)
+            days = self.tr("days")
+            for rec in self.sessions:
+                try:
+                    s = datetime.datetime.fromisoformat(rec["start"])
+                    e = datetime.datetime.fromisoformat(rec["end"])
+                except Exception:
+                    continue
+                dur = int(rec.get("duration_s", int((e - s).total_seconds())))
+                r = self.sessionTable.rowCount()
+                self.sessionTable.insertRow(r)
+                day_name = days[s.weekday()] if 0 <= s.weekday() < 7 else ""
+                day_item = QtWidgets.QTableWidgetItem(day_name)
+                day_item.setTextAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
+                self.sessionTable.setItem(r, 0, day_item)
+
+                date_item = QtWidgets.QTableWidgetItem(self._format_date(s))
+                date_item.setTextAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
+                self.sessionTable.setItem(r, 1, date_item)
+
+                start_item = QtWidgets.QTableWidgetItem(self._format_time(s))
+                start_item.setTextAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
+                self.sessionTable.setItem(r, 2, start_item)
+
+                end_item = QtWidgets.QTableWidgetItem(self._format_time(e))
+                end_item.setTextAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
+                self.sessionTable.setItem(r, 3, end_item)
+
+                duration_item = QtWidgets.QTableWidgetItem(
+                    f"{dur // 3600:02d}:{(dur % 3600) // 60:02d}"
+                )
+                duration_item.setTextAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
+                self.sessionTable.setItem(r, 4, duration_item)
 
     # ---- tray helpers ----
     def _tray_show(self) -> None:
+        # files may have been removed while the window sat in the tray
+        self._prune_missing_files()
         self.showNormal()
         self.raise_()
         self.activateWindow()
 
     def _tray_exit(self) -> None:
+        self._shutdown()
+        QtWidgets.QApplication.quit()
+
+    def _shutdown(self) -> None:
+        """Stop audio and flush clips before the app goes away (safe to repeat)."""
         try:
             if self.stream:
                 self.stream.stop()
                 self.stream.close()
         except Exception:
             pass
+        self.stream = None
+        # saves the clip in progress; a running QThread must not outlive the app
+        self._stop_processor()
+        self._writer.shutdown(wait=True)  # let queued clips finish encoding
+        if self._zip_export is not None:
+            # same for an export; interrupted, it removes its partial archive
+            worker = self._zip_export[0]
+            worker.requestInterruption()
+            worker.wait()
         try:
             self.player.stop()
         except Exception:
             pass
-        QtWidgets.QApplication.quit()
 
     def closeEvent(self, e: QtGui.QCloseEvent) -> None:
         # Hide to tray; “Exit” iz tray menija za pravo gašenje
@@ -2008,6 +3063,7 @@ SOFTWARE."""
             e.ignore()
             self.hide()
         else:
+            self._shutdown()
             super().closeEvent(e)
 
 
@@ -2015,6 +3071,8 @@ SOFTWARE."""
 def main() -> None:
     # upozorenje ako PortAudio nije spreman
     try:
+        import sounddevice as sd
+
         test = sd.InputStream(samplerate=44100, channels=1, blocksize=256)
         test.close()
     except Exception:
@@ -2033,7 +3091,10 @@ def main() -> None:
         pass
 
     app = QtWidgets.QApplication(sys.argv)
+    app.aboutToQuit.connect(clear_icon_cache)
     w = SleepTracker()
+    # any other way out (session end, Ctrl+C in the loop) gets the same cleanup
+    app.aboutToQuit.connect(w._shutdown)
     w.apply_theme()
     w.show()
     sys.exit(app.exec())